@@ -0,0 +1,37 @@
+"""
+One BigQuery client per project for the whole process: credential discovery (ADC, metadata server) runs once,
+however many scripts / load jobs ask for a client.
+"""
+import functools
+import re
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from google.cloud import bigquery
+
+USER_AGENT = "horizon-platform"
+
+# "... contains a wildcard but no files were matched" (load jobs) / "... matched no files" (external tables).
+_NO_FILES_MATCHED = re.compile(r"no files (were )?matched|matched no files", re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=4)
+def get_client(project: str) -> "bigquery.Client":
+    """Shared bigquery.Client for project (google-cloud-bigquery is imported on first use)."""
+    from google.api_core.client_info import ClientInfo
+    from google.cloud import bigquery
+
+    return bigquery.Client(project=project, client_info=ClientInfo(user_agent=USER_AGENT))
+
+
+def wildcard_matched_no_files(exc: BaseException, uri: str) -> bool:
+    """True if exc is BigQuery reporting that the wildcard uri matched no files (that source was not ingested)."""
+    from google.api_core.exceptions import BadRequest, NotFound
+
+    if not isinstance(exc, (NotFound, BadRequest)):
+        return False
+    message = str(exc)
+    if _NO_FILES_MATCHED.search(message):
+        return True
+    # "Not found: URI gs://bucket/raw/x/*.parquet" names the wildcard itself; a missing dataset or table does not.
+    return isinstance(exc, NotFound) and uri.lower() in message.lower()
@@ -1,12 +1,16 @@
 """
 Config from env: GCS bucket, BigQuery dataset, paths. Also: cutoff date, domain keywords, and skills taxonomy for extraction.
 """
+import functools
 import os
 from datetime import datetime, timezone, timedelta
-from typing import List, Optional
+from types import MappingProxyType
+from typing import FrozenSet, Mapping, Optional, Tuple
 
 # BigQuery: primary destination for ingestion (from Terraform: job_market_analysis)
 BIGQUERY_DATASET: str = os.environ.get("BIGQUERY_DATASET", "job_market_analysis")
+# Resolved once: blank env value falls back to the default dataset.
+_BIGQUERY_DATASET_RESOLVED: str = BIGQUERY_DATASET.strip() or "job_market_analysis"
 
 # GCS: required for step 1 (dlt → GCS Parquet); also used by load_gcs_to_bigquery.py
 GCS_BUCKET: str = os.environ.get("GCS_BUCKET", "")
@@ -15,8 +19,10 @@ GCS_PREFIX: str = os.environ.get("GCS_PREFIX", "raw")
 # Last 3 years cutoff (UTC)
 CUTOFF_DATE = (datetime.now(timezone.utc) - timedelta(days=3 * 365)).date()
 
+# Constants below are read-only (tuples / MappingProxyType): shared by every source and never mutated at runtime.
+
 # Data-domain keywords for filtering (title/description/skills)
-DATA_DOMAIN_KEYWORDS: List[str] = [
+DATA_DOMAIN_KEYWORDS: Tuple[str, ...] = (
     "data engineer",
     "data engineering",
     "data science",
@@ -34,22 +40,24 @@ DATA_DOMAIN_KEYWORDS: List[str] = [
     "data pipeline",
     "data warehouse",
     "data lake",
-]
+)
 
 # Hugging Face job_title_short values that are data-domain (use when present)
-DATA_DOMAIN_JOB_TITLES: List[str] = [
+DATA_DOMAIN_JOB_TITLES: Tuple[str, ...] = (
     "Data Engineer",
     "Data Scientist",
     "Data Analyst",
     "Analytics Engineer",
     "Business Analyst",
     "Machine Learning Engineer",
-]
+)
+# O(1) membership for per-row checks (filters.data_domain_only); vectorized paths use pyarrow.compute.is_in.
+DATA_DOMAIN_JOB_TITLES_SET: FrozenSet[str] = frozenset(DATA_DOMAIN_JOB_TITLES)
 
 # Curated data-engineering skills for taxonomy-based extraction (Kaggle DE and similar).
 # Order: longer phrases first so "google cloud" matches before "cloud".
 # Aliases map variant -> canonical name (e.g. "pyspark" -> "Spark").
-DATA_ENGINEER_SKILLS: List[str] = [
+DATA_ENGINEER_SKILLS: Tuple[str, ...] = (
     "apache spark",
     "apache kafka",
     "apache airflow",
@@ -113,11 +121,11 @@ DATA_ENGINEER_SKILLS: List[str] = [
     "great expectations",
     "dagster",
     "prefect",
-]
+)
 
 # Aliases: text that matches in description -> canonical skill name for output.
 # Keys are lowercase; values are the canonical label to emit.
-DATA_ENGINEER_SKILL_ALIASES: dict[str, str] = {
+DATA_ENGINEER_SKILL_ALIASES: Mapping[str, str] = MappingProxyType({
     "pyspark": "Spark",
     "apache spark": "Spark",
     "spark": "Spark",
@@ -176,7 +184,7 @@ DATA_ENGINEER_SKILL_ALIASES: dict[str, str] = {
     "great expectations": "Great Expectations",
     "dagster": "Dagster",
     "prefect": "Prefect",
-}
+})
 
 
 def normalize_gcs_bucket(raw: str) -> str:
@@ -219,8 +227,9 @@ def gcs_bucket_config_error(bucket: str) -> Optional[str]:
     return None
 
 
+@functools.lru_cache(maxsize=None)
 def get_gcs_base_url() -> str:
-    """Base URL for raw data in GCS (e.g. gs://bucket/raw)."""
+    """Base URL for raw data in GCS (e.g. gs://bucket/raw). Env is read at import, so resolve + validate once."""
     bucket = normalize_gcs_bucket(GCS_BUCKET)
     err = gcs_bucket_config_error(bucket)
     if err:
@@ -230,4 +239,4 @@ def get_gcs_base_url() -> str:
 
 def get_bigquery_dataset() -> str:
     """BigQuery dataset for raw/silver tables (e.g. job_market_analysis)."""
-    return BIGQUERY_DATASET.strip() or "job_market_analysis"
+    return _BIGQUERY_DATASET_RESOLVED
@@ -1,8 +1,40 @@
 """Date and domain filters for last-3-years data-domain-only rows."""
+import re
 from datetime import date
 from typing import List, Optional
 
-from ingestion.config import CUTOFF_DATE, DATA_DOMAIN_JOB_TITLES, DATA_DOMAIN_KEYWORDS
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from ingestion.config import CUTOFF_DATE, DATA_DOMAIN_JOB_TITLES_SET, DATA_DOMAIN_KEYWORDS
+
+try:
+    import ahocorasick
+except ImportError:  # optional: pyahocorasick; fall back to one compiled alternation
+    ahocorasick = None
+
+# Keywords are lowercased once here; matching is plain substring (same as `kw in text`).
+_DATA_DOMAIN_KEYWORDS_LC = tuple(kw.lower() for kw in DATA_DOMAIN_KEYWORDS)
+# Same keywords as one substring alternation (Python re / RE2 compatible) for vectorized matching on
+# already-lowercased text columns, e.g. pyarrow.compute.match_substring_regex.
+DATA_DOMAIN_KEYWORDS_REGEX: str = "|".join(map(re.escape, _DATA_DOMAIN_KEYWORDS_LC))
+
+# Arrow value set for pyarrow.compute.is_in on job_title_short (built once, not per batch).
+_JOB_TITLES_VALUE_SET = pa.array(sorted(DATA_DOMAIN_JOB_TITLES_SET), type=pa.string())
+
+if ahocorasick is not None:
+    _KEYWORD_AUTOMATON = ahocorasick.Automaton()
+    for _kw in _DATA_DOMAIN_KEYWORDS_LC:
+        _KEYWORD_AUTOMATON.add_word(_kw, _kw)
+    _KEYWORD_AUTOMATON.make_automaton()
+
+    def _has_keyword(text: str) -> bool:
+        return next(_KEYWORD_AUTOMATON.iter(text), None) is not None
+else:
+    _KEYWORD_RE = re.compile(DATA_DOMAIN_KEYWORDS_REGEX)
+
+    def _has_keyword(text: str) -> bool:
+        return _KEYWORD_RE.search(text) is not None
 
 
 def last_3_years(posted_date: Optional[date]) -> bool:
@@ -33,15 +65,31 @@ def data_domain_only(
 ) -> bool:
     """
     True if the row is in the data domain (title/description/skills or job_title_short).
-    Uses job_title_short when present (e.g. Hugging Face), else keyword match.
+    Uses job_title_short when present (e.g. Hugging Face), else keyword match (single pass over the text).
     """
-    if job_title_short and job_title_short.strip():
-        if job_title_short.strip() in DATA_DOMAIN_JOB_TITLES:
-            return True
+    if job_title_short and job_title_short.strip() in DATA_DOMAIN_JOB_TITLES_SET:
+        return True
     text = _combined_text(title, description, skills)
     if not text:
         return False
-    for kw in DATA_DOMAIN_KEYWORDS:
-        if kw.lower() in text:
-            return True
-    return False
+    return _has_keyword(text)
+
+
+def data_domain_mask(
+    *,
+    title: pa.Array,
+    description: pa.Array,
+    skills: pa.Array,
+    job_title_short: Optional[pa.Array] = None,
+) -> pa.Array:
+    """
+    Vectorized data_domain_only: one boolean per row over aligned Arrow string arrays, null = field missing.
+    skills holds the skills already joined with spaces; job_title_short is expected stripped.
+    """
+    # Non-null fields joined with spaces like _combined_text, lowercased, then one regex pass in C.
+    # Leading "" keeps every row non-null for null_handling="skip" (keywords never start with a space).
+    combined = pc.binary_join_element_wise("", title, description, skills, " ", null_handling="skip")
+    hit = pc.match_substring_regex(pc.utf8_lower(combined), DATA_DOMAIN_KEYWORDS_REGEX)
+    if job_title_short is None:
+        return hit
+    return pc.or_(pc.is_in(job_title_short, value_set=_JOB_TITLES_VALUE_SET.cast(job_title_short.type)), hit)
@@ -1,42 +1,66 @@
 """
 Shared dlt pipeline: one runner for all sources. Stream function yields batches of job dicts → dlt writes Parquet to GCS.
 """
+import functools
 import logging
-import os
-from typing import Callable, Iterator
-
-import dlt
+from typing import TYPE_CHECKING, Any, Callable, Iterator
 
 from ingestion.config import get_gcs_base_url
 from ingestion.schema import JOBS_COLUMNS
 
+if TYPE_CHECKING:
+    import dlt
+
 logger = logging.getLogger(__name__)
 
 TABLE_NAME = "jobs"
 
+# dlt Parquet writer defaults for GCS → BigQuery loads, as dlt config keys (NORMALIZE__DATA_WRITER__* env vars and
+# config.toml still win). dlt writes one row group per buffer flush, so buffer_max_items (default 5000) sets the
+# row-group size. Fewer, larger, zstd-compressed files mean fewer GCS objects and fewer bytes for
+# load_gcs_to_bigquery.py.
+PARQUET_WRITER_DEFAULTS: dict[str, Any] = {
+    "normalize.data_writer.buffer_max_items": 50_000,
+    "normalize.data_writer.file_max_bytes": 256 * 1024 * 1024,
+    "normalize.data_writer.compression": "zstd",
+    "normalize.data_writer.version": "2.6",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _apply_parquet_writer_defaults() -> None:
+    """Once per process: put PARQUET_WRITER_DEFAULTS into dlt's in-memory config where nothing is configured yet."""
+    import dlt
+
+    for key, value in PARQUET_WRITER_DEFAULTS.items():
+        if dlt.config.get(key) is None:
+            dlt.config[key] = value
+
 
 def run_pipeline(
     pipeline_name: str,
     dataset_name: str,
     stream_fn: Callable[[], Iterator[list[dict]]],
-) -> dlt.Pipeline:
+) -> "dlt.Pipeline":
     """Run one dlt pipeline: stream_fn() yields batches → dlt writes Parquet to gs://bucket/raw/<dataset_name>/ (replace)."""
     # dlt filesystem destination appends dataset_name under BUCKET_URL; do not repeat dataset_name here or paths become
     # raw/<dataset>/<dataset>/ and load_gcs_to_bigquery.py (raw/<suffix>/) will not find Parquet.
-    bucket_base = get_gcs_base_url()
-    os.environ["DESTINATION__FILESYSTEM__BUCKET_URL"] = bucket_base.rstrip("/")
+    # dlt is imported here, not at module top: importing the pipeline modules (CLI, DAG parse) stays cheap.
+    import dlt
+
+    # Bucket URL is passed per pipeline (not via DESTINATION__FILESYSTEM__BUCKET_URL): concurrent runs share no env.
+    destination = dlt.destinations.filesystem(bucket_url=get_gcs_base_url().rstrip("/"))
+    _apply_parquet_writer_defaults()
 
-    @dlt.resource(name=TABLE_NAME, write_disposition="replace", columns=JOBS_COLUMNS)
-    def jobs_resource() -> Iterator[dict]:
-        for batch in stream_fn():
-            for row in batch:
-                yield row
+    # stream_fn() yields lists of rows; dlt treats each yielded list as a page of items, so batches go straight
+    # to the normalizer with no per-row Python generator in between.
+    jobs_resource = dlt.resource(stream_fn(), name=TABLE_NAME, write_disposition="replace", columns=JOBS_COLUMNS)
 
     pipeline = dlt.pipeline(
         pipeline_name=pipeline_name,
-        destination="filesystem",
+        destination=destination,
         dataset_name=dataset_name,
     )
-    load_info = pipeline.run(jobs_resource(), loader_file_format="parquet")
+    load_info = pipeline.run(jobs_resource, loader_file_format="parquet")
     logger.info("Pipeline %s load_info: %s", pipeline_name, load_info)
     return pipeline
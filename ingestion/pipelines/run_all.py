@@ -0,0 +1,44 @@
+"""
+Run several dlt pipelines concurrently. Each source streams to its own gs://bucket/raw/<dataset>/ prefix and is
+I/O-bound (downloads, GCS writes), so threads overlap the waits; wall time ~ slowest source instead of the sum.
+"""
+import importlib
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional, Sequence
+
+logger = logging.getLogger(__name__)
+
+# CLI source name -> pipeline module exposing run(); imported lazily so unused sources cost nothing.
+PIPELINE_MODULES: dict[str, str] = {
+    "huggingface": "ingestion.pipelines.run_huggingface",
+    "kaggle_data_engineer": "ingestion.pipelines.run_kaggle_data_engineer",
+    "kaggle_linkedin": "ingestion.pipelines.run_kaggle_linkedin",
+    "kaggle_linkedin_skills": "ingestion.pipelines.run_kaggle_linkedin_skills",
+}
+
+
+def run_one(name: str) -> None:
+    """Import and run a single pipeline by source name."""
+    logger.info("Starting pipeline: %s", name)
+    importlib.import_module(PIPELINE_MODULES[name]).run()
+
+
+def run_all(names: Optional[Sequence[str]] = None, max_workers: int = 4) -> dict[str, BaseException]:
+    """
+    Run the named pipelines (default: all) in a thread pool. One failure does not cancel the others.
+    Returns {name: exception} for failed pipelines (empty dict when all succeeded).
+    """
+    to_run = list(names or PIPELINE_MODULES)
+    failures: dict[str, BaseException] = {}
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(to_run)))) as pool:
+        futures = {pool.submit(run_one, name): name for name in to_run}
+        for fut in as_completed(futures):
+            name = futures[fut]
+            try:
+                fut.result()
+                logger.info("Completed pipeline: %s", name)
+            except Exception as e:
+                logger.exception("Pipeline %s failed: %s", name, e)
+                failures[name] = e
+    return failures
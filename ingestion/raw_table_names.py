@@ -7,3 +7,8 @@ RAW_TABLE_IDS: tuple[str, ...] = (
     "raw_kaggle_linkedin_postings",
     "raw_kaggle_linkedin_jobs_skills_2024",
 )
+
+
+def raw_gcs_prefix(table_id: str) -> str:
+    """GCS prefix the dlt pipeline writes a raw table's Parquet files under: raw_<name> -> "raw/<name>/"."""
+    return f"raw/{table_id.removeprefix('raw_')}/"
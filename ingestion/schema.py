@@ -41,3 +41,36 @@ class RawJobRow(BaseModel):
     def to_load_dict(self) -> dict[str, Any]:
         """Dict suitable for dlt load (serialize dates/datetimes)."""
         return self.model_dump(mode="json")
+
+
+def job_load_dict(
+    *,
+    source_id: str,
+    source_name: str,
+    job_title: Optional[str] = None,
+    job_description: Optional[str] = None,
+    company_name: Optional[str] = None,
+    location: Optional[str] = None,
+    posted_date: Optional[date] = None,
+    job_url: Optional[str] = None,
+    skills: Optional[List[str]] = None,
+    salary_info: Optional[str] = None,
+    ingested_at: str,
+) -> dict[str, Any]:
+    """
+    Same dict as RawJobRow(...).to_load_dict(), built without model validation, for per-row ingestion hot paths
+    where values are already typed. ingested_at is an ISO-8601 string (serialize once, reuse across rows).
+    """
+    return {
+        "source_id": source_id,
+        "source_name": source_name,
+        "job_title": job_title,
+        "job_description": job_description,
+        "company_name": company_name,
+        "location": location,
+        "posted_date": posted_date.isoformat() if posted_date is not None else None,
+        "job_url": job_url,
+        "skills": skills,
+        "salary_info": salary_info,
+        "ingested_at": ingested_at,
+    }
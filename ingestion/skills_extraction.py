@@ -1,8 +1,11 @@
 """Skills extraction from job title/description: taxonomy-based and LLM (Gemini)."""
+import asyncio
 import json
 import logging
 import os
+import random
 import re
+import sys
 from typing import Optional
 
 from ingestion.config import (
@@ -10,21 +13,32 @@ from ingestion.config import (
     DATA_ENGINEER_SKILLS,
 )
 
-logger = logging.getLogger(__name__)
+try:
+    import orjson
+except ImportError:  # optional: orjson; fall back to stdlib json
+    orjson = None
 
-# Match whole-word or phrase (word boundary for single words; allow hyphen/underscore in tokens)
-def _make_pattern(skill: str) -> re.Pattern[str]:
-    escaped = re.escape(skill)
-    if " " in skill or "/" in skill:
-        return re.compile(rf"\b{escaped}\b", re.IGNORECASE)
-    return re.compile(rf"\b{escaped}\b", re.IGNORECASE)
+logger = logging.getLogger(__name__)
 
+# All skills fused into one alternation (longest first), so each row is scanned once instead of once per skill.
+# The lookahead makes every match zero-width: overlapping skills that start at different positions are all
+# reported (e.g. "google cloud storage" -> GCP and Cloud Storage), matching the old one-pattern-per-skill result.
+# Keys are interned lowercase skills; values are the canonical names, with the .title() fallback precomputed.
+_CANONICAL_BY_SKILL: dict[str, str] = {
+    sys.intern(_skill.lower()): DATA_ENGINEER_SKILL_ALIASES.get(_skill.lower(), _skill.title())
+    for _skill in DATA_ENGINEER_SKILLS
+}
+_SKILLS_RE = re.compile(
+    r"(?=\b("
+    + "|".join(re.escape(s) for s in sorted(_CANONICAL_BY_SKILL, key=len, reverse=True))
+    + r")\b)",
+    re.IGNORECASE,
+)
+# Texts shorter than the shortest skill cannot match; skip the regex pass entirely.
+_MIN_SKILL_LEN = min(map(len, _CANONICAL_BY_SKILL))
 
-# Precompile patterns for DATA_ENGINEER_SKILLS (longer phrases first)
-_SKILL_PATTERNS: list[tuple[re.Pattern[str], str]] = []
-for _skill in DATA_ENGINEER_SKILLS:
-    canonical = DATA_ENGINEER_SKILL_ALIASES.get(_skill.lower(), _skill.title())
-    _SKILL_PATTERNS.append((_make_pattern(_skill), canonical))
+# Description characters per job sent in a batch prompt (~500 tokens); skills cluster early in job ads.
+LLM_BATCH_DESCRIPTION_CHARS = 2000
 
 
 def extract_skills_taxonomy(
@@ -43,10 +57,10 @@ def extract_skills_taxonomy(
     if not text_parts:
         return []
     text = " ".join(text_parts).lower()
-    found: set[str] = set()
-    for pattern, canonical in _SKILL_PATTERNS:
-        if pattern.search(text):
-            found.add(canonical)
+    if len(text) < _MIN_SKILL_LEN:
+        return []
+    # Matches are normally exact keys; .title() only runs for case-folded oddities (e.g. "ſpark").
+    found = {_CANONICAL_BY_SKILL.get(g) or g.title() for g in (m.group(1) for m in _SKILLS_RE.finditer(text))}
     return sorted(found)
 
 
@@ -59,19 +73,30 @@ Job title: {title}
 Job description:
 {description}"""
 
+# Opening fence line (```json etc.) and a closing ``` line; applied only when the response starts with ```.
+_FENCE_RE = re.compile(r"\A```[^\n]*(?:\n|\Z)|\n[ \t\r]*```\Z")
+
+
+def _strip_code_fence(s: str) -> str:
+    """Drop a markdown code fence around an already-stripped model response."""
+    return _FENCE_RE.sub("", s) if s.startswith("```") else s
+
+
+def _json_loads(s: str):
+    """orjson when installed (raises a json.JSONDecodeError subclass), else stdlib json."""
+    return orjson.loads(s) if orjson is not None else json.loads(s)
+
 
 def _parse_skills_json(raw: str) -> list[str]:
     """Parse model output into list of skill strings. Tolerates markdown code blocks."""
     s = raw.strip()
     if not s:
         return []
-    if s.startswith("```"):
-        lines = s.split("\n")
-        s = "\n".join(lines[1:-1] if lines[-1].strip() == "```" else lines[1:])
+    s = _strip_code_fence(s)
     try:
-        out = json.loads(s)
+        out = _json_loads(s)
         if isinstance(out, list):
-            return [str(x).strip() for x in out if x and str(x).strip()]
+            return [t for x in out if x and (t := str(x).strip())]
         return []
     except json.JSONDecodeError:
         logger.debug("Could not parse skills JSON: %s", raw[:200])
@@ -109,16 +134,50 @@ def extract_skills_llm(
         return []
 
 
+def _batch_prompt(
+    batch: list[tuple[Optional[str], Optional[str]]],
+    max_desc_chars: int = LLM_BATCH_DESCRIPTION_CHARS,
+) -> str:
+    """One prompt for several jobs; the model answers with one skills array per job, in order."""
+    numbered = "\n\n---\n\n".join(
+        f"Job {j+1}.\nTitle: {(t or '').strip() or '(none)'}\n"
+        f"Description:\n{(d or '').strip()[:max_desc_chars] or '(none)'}"
+        for j, (t, d) in enumerate(batch)
+    )
+    return f"""For each job below, extract only the technical skills and tools mentioned.
+Return a JSON array of arrays: one array per job, in order. Example: [["Python","SQL"], ["AWS","Kafka"]].
+No other text.
+
+{numbered}"""
+
+
+def _parse_batch_response(text: Optional[str], n: int) -> list[list[str]]:
+    """n skill lists from a batch response; [] for every job when the response is missing or malformed."""
+    if not text:
+        return [[] for _ in range(n)]
+    arr = _json_loads(_strip_code_fence(text.strip()))
+    if not isinstance(arr, list) or len(arr) < n:
+        return [[] for _ in range(n)]
+    return [
+        [t for x in arr[k] if x and (t := str(x).strip())] if isinstance(arr[k], list) else []
+        for k in range(n)
+    ]
+
+
 def extract_skills_llm_batch(
     rows: list[tuple[Optional[str], Optional[str]]],
     *,
     model_name: str = "gemini-1.5-flash",
     api_key: Optional[str] = None,
     batch_size: int = 10,
+    max_desc_chars: int = LLM_BATCH_DESCRIPTION_CHARS,
+    timeout: float = 120.0,
+    max_output_tokens: int = 4096,
 ) -> list[list[str]]:
     """
     Run LLM skills extraction on multiple rows. Each row is (title, description).
-    Returns a list of skill lists, one per row. Batches multiple jobs into one prompt to reduce cost.
+    Returns a list of skill lists, one per row. Batches multiple jobs into one prompt to reduce cost;
+    each description is cut to max_desc_chars, and each request has a timeout and output-token cap.
     """
     api_key = api_key or os.environ.get("GOOGLE_API_KEY") or os.environ.get("GEMINI_API_KEY")
     if not api_key:
@@ -127,37 +186,77 @@ def extract_skills_llm_batch(
     results: list[list[str]] = []
     for i in range(0, len(rows), batch_size):
         batch = rows[i : i + batch_size]
-        numbered = "\n\n---\n\n".join(
-            f"Job {j+1}.\nTitle: {(t or '').strip() or '(none)'}\nDescription:\n{(d or '').strip()[:2000] or '(none)'}"
-            for j, (t, d) in enumerate(batch)
-        )
-        prompt = f"""For each job below, extract only the technical skills and tools mentioned.
-Return a JSON array of arrays: one array per job, in order. Example: [["Python","SQL"], ["AWS","Kafka"]].
-No other text.
-
-{numbered}"""
+        prompt = _batch_prompt(batch, max_desc_chars)
         try:
             import google.generativeai as genai
             genai.configure(api_key=api_key)
             model = genai.GenerativeModel(model_name=model_name)
-            response = model.generate_content(prompt)
-            if not response or not response.text:
-                results.extend([[] for _ in batch])
-                continue
-            raw = response.text.strip()
-            if raw.startswith("```"):
-                lines = raw.split("\n")
-                raw = "\n".join(lines[1:-1] if lines[-1].strip() == "```" else lines[1:])
-            arr = json.loads(raw)
-            if isinstance(arr, list) and len(arr) >= len(batch):
-                for k in range(len(batch)):
-                    if k < len(arr) and isinstance(arr[k], list):
-                        results.append([str(x).strip() for x in arr[k] if x and str(x).strip()])
-                    else:
-                        results.append([])
-            else:
-                results.extend([[] for _ in batch])
+            response = model.generate_content(
+                prompt,
+                generation_config={"max_output_tokens": max_output_tokens},
+                request_options={"timeout": timeout},
+            )
+            results.extend(_parse_batch_response(response.text if response else None, len(batch)))
         except Exception as e:
             logger.warning("Gemini batch skills extraction failed for batch: %s", e)
             results.extend([[] for _ in batch])
     return results
+
+
+async def extract_skills_llm_batch_async(
+    rows: list[tuple[Optional[str], Optional[str]]],
+    *,
+    model_name: str = "gemini-1.5-flash",
+    api_key: Optional[str] = None,
+    batch_size: int = 10,
+    concurrency: int = 4,
+    retries: int = 3,
+    max_desc_chars: int = LLM_BATCH_DESCRIPTION_CHARS,
+    timeout: float = 120.0,
+    max_output_tokens: int = 4096,
+) -> list[list[str]]:
+    """
+    extract_skills_llm_batch with up to `concurrency` batch requests in flight (asyncio + generate_content_async).
+    Each request has a timeout and output-token cap, and is retried with exponential backoff and jitter;
+    a batch that still fails gives [] for each of its rows. Results keep the order of rows.
+    """
+    api_key = api_key or os.environ.get("GOOGLE_API_KEY") or os.environ.get("GEMINI_API_KEY")
+    if not api_key:
+        logger.warning("No API key for Gemini; set GOOGLE_API_KEY or GEMINI_API_KEY. Returning [] for all.")
+        return [[] for _ in rows]
+    try:
+        import google.generativeai as genai
+    except ImportError as e:
+        logger.warning("Gemini batch skills extraction unavailable: %s", e)
+        return [[] for _ in rows]
+    genai.configure(api_key=api_key)
+    model = genai.GenerativeModel(model_name=model_name)
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(batch: list[tuple[Optional[str], Optional[str]]]) -> list[list[str]]:
+        prompt = _batch_prompt(batch, max_desc_chars)
+        async with semaphore:
+            for attempt in range(retries + 1):
+                try:
+                    response = await model.generate_content_async(
+                        prompt,
+                        generation_config={"max_output_tokens": max_output_tokens},
+                        request_options={"timeout": timeout},
+                    )
+                    break
+                except Exception as e:
+                    if attempt == retries:
+                        logger.warning("Gemini batch skills extraction failed for batch: %s", e)
+                        return [[] for _ in batch]
+                    # Holding the semaphore while backing off keeps the request rate down under throttling.
+                    await asyncio.sleep(2**attempt + random.random())
+        # An answer that is blocked or not valid JSON is not retried.
+        try:
+            return _parse_batch_response(response.text if response else None, len(batch))
+        except ValueError as e:
+            logger.warning("Gemini batch skills extraction failed for batch: %s", e)
+            return [[] for _ in batch]
+
+    batches = [rows[i : i + batch_size] for i in range(0, len(rows), batch_size)]
+    per_batch = await asyncio.gather(*(run(b) for b in batches))
+    return [skills for batch_skills in per_batch for skills in batch_skills]
@@ -0,0 +1,171 @@
+"""
+Stream selected CSV columns with pyarrow's incremental CSV reader (multithreaded parsing, Arrow string storage),
+or from a one-time zstd Parquet copy of the CSV when there is one (csv_to_parquet).
+Column names match pandas (duplicate headers mangled to "name.1", ...) so the Kaggle column maps keep working.
+"""
+import logging
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Deque, Iterable, Iterator, List, Optional, Sequence, TypeVar
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# Set to N > 1 to map CSV blocks to rows in N worker processes (default: in-process, as before).
+PROCESS_WORKERS = int(os.environ.get("INGEST_PROCESS_WORKERS", "").strip() or 0)
+
+# 8 MiB of CSV text per parsed block (pyarrow default is 1 MiB).
+BLOCK_SIZE = 8 << 20
+# Rows per batch when reading the Parquet copy of a CSV.
+PARQUET_BATCH_ROWS = 65_536
+# pandas read_csv default NA strings, so missing cells are the same as with pd.read_csv.
+PANDAS_NA_VALUES: List[str] = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN",
+    "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+]
+
+
+def csv_header(csv_path: Path) -> pd.Index:
+    """Column names as pd.read_csv reports them (header row only)."""
+    return pd.read_csv(csv_path, nrows=0).columns
+
+
+def _skip_invalid_row(row: pacsv.InvalidRow) -> str:
+    logger.warning(
+        "Skipping malformed CSV row %s (expected %d columns, got %d)",
+        row.number,
+        row.expected_columns,
+        row.actual_columns,
+    )
+    return "skip"
+
+
+@contextmanager
+def _open_csv(csv_path: Path, columns: Sequence[str], block_size: int) -> Iterator[pacsv.CSVStreamingReader]:
+    """
+    Incremental reader over the given columns ([] = all), every column typed as string. The file is memory-mapped,
+    so blocks are parsed from the page cache without first being copied into read buffers.
+    """
+    names = list(csv_header(csv_path))
+    wanted = list(columns) or names
+    with pa.memory_map(str(csv_path), "r") as source:
+        yield pacsv.open_csv(
+            source,
+            read_options=pacsv.ReadOptions(block_size=block_size, use_threads=True, column_names=names, skip_rows=1),
+            parse_options=pacsv.ParseOptions(newlines_in_values=True, invalid_row_handler=_skip_invalid_row),
+            convert_options=pacsv.ConvertOptions(
+                include_columns=wanted,
+                column_types={c: pa.string() for c in wanted},
+                null_values=PANDAS_NA_VALUES,
+                strings_can_be_null=True,
+            ),
+        )
+
+
+def parquet_sibling(csv_path: Path) -> Path:
+    """Where csv_to_parquet writes the columnar copy of csv_path."""
+    return csv_path.with_suffix(".parquet")
+
+
+def _fresh_parquet(csv_path: Path) -> Optional[Path]:
+    """The Parquet copy of csv_path if it exists and is not older than the CSV."""
+    parquet_path = parquet_sibling(csv_path)
+    if parquet_path.exists() and parquet_path.stat().st_mtime >= csv_path.stat().st_mtime:
+        return parquet_path
+    return None
+
+
+def csv_to_parquet(csv_path: Path, *, block_size: int = BLOCK_SIZE) -> Path:
+    """
+    Transcode csv_path once into a zstd Parquet file next to it (all columns as strings, pandas column names).
+    Later iter_csv_frames calls read the Parquet copy: column projection without re-parsing the CSV text.
+    """
+    parquet_path = parquet_sibling(csv_path)
+    tmp_path = parquet_path.with_name(parquet_path.name + ".tmp")
+    try:
+        with _open_csv(csv_path, [], block_size) as reader:
+            with pq.ParquetWriter(tmp_path, reader.schema, compression="zstd") as writer:
+                for record_batch in reader:
+                    writer.write_batch(record_batch)
+    except BaseException:
+        # Leave nothing behind: without a Parquet copy iter_csv_frames reads the CSV.
+        tmp_path.unlink(missing_ok=True)
+        raise
+    # Rename last so a partial file is never picked up as a fresh copy.
+    os.replace(tmp_path, parquet_path)
+    logger.info("Transcoded %s -> %s", csv_path, parquet_path.name)
+    return parquet_path
+
+
+def _frames(batches: Iterable[pa.RecordBatch]) -> Iterator[pd.DataFrame]:
+    """One DataFrame per record batch, with continuous row labels across batches."""
+    offset = 0
+    for record_batch in batches:
+        frame = record_batch.to_pandas()
+        # Like pd.read_csv(chunksize=...).
+        frame.index = pd.RangeIndex(offset, offset + len(frame))
+        offset += len(frame)
+        yield frame
+
+
+def iter_csv_frames(
+    csv_path: Path,
+    columns: Sequence[str],
+    *,
+    block_size: int = BLOCK_SIZE,
+) -> Iterator[pd.DataFrame]:
+    """
+    Yield DataFrames with the given columns (all strings, missing -> NA), one per CSV block / Parquet batch.
+    Reads the Parquet copy from csv_to_parquet when it is up to date, else parses the CSV; only the requested
+    columns are decoded either way.
+    """
+    parquet_path = _fresh_parquet(csv_path)
+    if parquet_path is not None:
+        parquet = pq.ParquetFile(parquet_path)
+        yield from _frames(parquet.iter_batches(batch_size=PARQUET_BATCH_ROWS, columns=list(columns) or None))
+    else:
+        with _open_csv(csv_path, columns, block_size) as reader:
+            yield from _frames(reader)
+
+
+def infer_numeric(values: pd.Series) -> pd.Series:
+    """read_csv-style inference for a string column: when every present value is numeric, return numbers."""
+    numbers = pd.to_numeric(values, errors="coerce")
+    if numbers.notna().sum() == values.notna().sum():
+        return numbers
+    return values
+
+
+def map_chunks(
+    fn: Callable[..., R],
+    chunks: Iterable[T],
+    *args: Any,
+    workers: int = PROCESS_WORKERS,
+) -> Iterator[R]:
+    """
+    Yield fn(chunk, *args) for each chunk, in input order. With workers > 1 the calls run in a process pool
+    (fn must be a module-level function) with at most 2 * workers chunks in flight, so memory stays bounded while
+    the parent keeps reading the CSV.
+    """
+    if workers <= 1:
+        for chunk in chunks:
+            yield fn(chunk, *args)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending: Deque[Future] = deque()
+        for chunk in chunks:
+            pending.append(pool.submit(fn, chunk, *args))
+            if len(pending) >= 2 * workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
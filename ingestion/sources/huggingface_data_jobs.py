@@ -1,13 +1,16 @@
 """Hugging Face lukebarousse/data_jobs: load, filter (last 3 years, data domain), yield batches."""
+import functools
 import logging
 import os
-from datetime import date, datetime
-from typing import Any, Iterator, List, Optional
+from datetime import date, datetime, timezone
+from typing import Any, Callable, Iterator, List, Optional
 
-from datasets import load_dataset
+import pyarrow as pa
+import pyarrow.compute as pc
 
-from ingestion.filters import data_domain_only, last_3_years
-from ingestion.schema import RawJobRow
+from ingestion.config import CUTOFF_DATE
+from ingestion.filters import data_domain_mask
+from ingestion.schema import job_load_dict
 
 logger = logging.getLogger(__name__)
 
@@ -28,19 +31,25 @@ def _parse_date(value: Any) -> Optional[date]:
     if isinstance(value, datetime):
         return value.date()
     if isinstance(value, str):
-        try:
-            return datetime.fromisoformat(value.replace("Z", "+00:00")).date()
-        except (ValueError, TypeError):
-            return None
+        return _parse_date_str(value)
     return None
 
 
+@functools.lru_cache(maxsize=4096)
+def _parse_date_str(value: str) -> Optional[date]:
+    """ISO string -> date, memoized: many postings share the same job_posted_date string."""
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00")).date()
+    except (ValueError, TypeError):
+        return None
+
+
 def _skills_list(value: Any) -> Optional[List[str]]:
     """Normalize job_skills to list of strings."""
     if value is None:
         return None
     if isinstance(value, list):
-        out = [str(s).strip() for s in value if s is not None and str(s).strip()]
+        out = [t for s in value if s is not None and (t := str(s).strip())]
         return out or None
     if isinstance(value, str):
         s = value.strip()
@@ -56,39 +65,85 @@ def _job_type_skills_text(value: Any) -> Optional[str]:
         s = value.strip()
         return s or None
     if isinstance(value, list):
-        parts = [str(x).strip() for x in value if x is not None and str(x).strip()]
+        parts = [t for x in value if x is not None and (t := str(x).strip())]
         return "\n".join(parts) if parts else None
     s = str(value).strip()
     return s or None
 
 
-def _row_to_canonical(row: dict[str, Any]) -> Optional[RawJobRow]:
-    """Map HF row to canonical schema; return None if filtered out."""
-    posted = _parse_date(row.get("job_posted_date"))
-    if not last_3_years(posted):
+def _skills_text(value: Any) -> Optional[str]:
+    """job_skills as the text data_domain_only sees (skills joined with spaces)."""
+    skills = _skills_list(value)
+    return " ".join(skills) if skills else None
+
+
+def _title_text(value: Any) -> Optional[str]:
+    return str(value) if value else None
+
+
+def _text_column(
+    batch: pa.Table,
+    name: str,
+    to_text: Callable[[Any], Optional[str]],
+    *,
+    strip: bool,
+) -> pa.Array:
+    """
+    Column as strings for keyword matching, '' -> null (so joins skip it like filters._combined_text).
+    String columns stay vectorized; other types (lists, structs) go through to_text per value.
+    """
+    idx = batch.schema.get_field_index(name)
+    if idx < 0:
+        return pa.nulls(batch.num_rows, pa.string())
+    col = batch.column(idx)
+    if pa.types.is_string(col.type) or pa.types.is_large_string(col.type):
+        if strip:
+            col = pc.utf8_trim_whitespace(col)
+    else:
+        col = pa.array([to_text(v) for v in col.to_pylist()], type=pa.string())
+    return pc.if_else(pc.equal(col, ""), pa.scalar(None, col.type), col)
+
+
+def _domain_mask(batch: pa.Table) -> pa.Array:
+    """
+    Vectorized filters.data_domain_only over an Arrow batch: job_title_short in DATA_DOMAIN_JOB_TITLES_SET,
+    else any keyword in lower(title + job_type_skills + job_skills).
+    """
+    return data_domain_mask(
+        title=_text_column(batch, "job_title", _title_text, strip=False),
+        description=_text_column(batch, "job_type_skills", _job_type_skills_text, strip=True),
+        skills=_text_column(batch, "job_skills", _skills_text, strip=True),
+        job_title_short=_text_column(batch, "job_title_short", _title_text, strip=True),
+    )
+
+
+def _date_mask(batch: pa.Table, cutoff: date) -> Optional[pa.Array]:
+    """Vectorized posted >= cutoff when job_posted_date is a date/timestamp column; None -> check per row."""
+    idx = batch.schema.get_field_index("job_posted_date")
+    if idx < 0:
+        return None
+    col = batch.column(idx)
+    if not (pa.types.is_timestamp(col.type) or pa.types.is_date(col.type)):
         return None
+    return pc.fill_null(pc.greater_equal(pc.cast(col, pa.date32()), pa.scalar(cutoff, pa.date32())), False)
+
+
+def _row_to_load_dict(row: dict[str, Any], posted: date, ingested_at: str) -> dict[str, Any]:
+    """Map HF row (already inside the date window and data domain) to a canonical load dict (RawJobRow shape)."""
     title = row.get("job_title")
     # No full job ad body in this dataset; job_type_skills is the main free-text skills field.
     desc = _job_type_skills_text(row.get("job_type_skills"))
     skills = _skills_list(row.get("job_skills"))
-    job_title_short = row.get("job_title_short")
-    if not data_domain_only(
-        title=title,
-        description=desc,
-        skills=skills,
-        job_title_short=job_title_short,
-    ):
-        return None
     if EXTRACT_SKILLS_TAXONOMY:
         from ingestion.skills_extraction import extract_skills_taxonomy
 
-        title_s = title.strip() if isinstance(title, str) and title.strip() else None
+        title_s = (title.strip() or None) if isinstance(title, str) else None
         tax = extract_skills_taxonomy(title_s, desc)
         if not skills:
             skills = tax or None
         elif tax:
             skills = list(dict.fromkeys(list(skills) + tax))
-    return RawJobRow(
+    return job_load_dict(
         source_id=SOURCE_ID,
         source_name=SOURCE_NAME,
         job_title=title,
@@ -99,7 +154,7 @@ def _row_to_canonical(row: dict[str, Any]) -> Optional[RawJobRow]:
         job_url=None,
         skills=skills,
         salary_info=str(row.get("salary_year_avg")) if row.get("salary_year_avg") is not None else None,
-        ingested_at=datetime.now(),
+        ingested_at=ingested_at,
     )
 
 
@@ -110,24 +165,39 @@ def stream_huggingface_data_jobs(
     """
     Load lukebarousse/data_jobs, filter (last 3 years, data domain), yield batches of load dicts.
     """
+    # Imported on use: `datasets` is slow to import and only this stream needs it.
+    from datasets import load_dataset
+
     logger.info("Loading Hugging Face dataset lukebarousse/data_jobs (split=%s)", split)
     # trust_remote_code removed: unsupported in datasets>=3.x; this dataset loads as Parquet.
     ds = load_dataset("lukebarousse/data_jobs", split=split)
+    # Columnar batches (Arrow tables, not per-row dicts) via the public iter API, which also honours any
+    # indices mapping on the Dataset. Filters run per column; only surviving rows become Python dicts.
+    cutoff = CUTOFF_DATE
     count = 0
-    batch: List[dict[str, Any]] = []
-    for i, row in enumerate(ds):
-        if isinstance(row, dict):
-            item = row
-        else:
-            item = row if hasattr(row, "keys") else dict(row)
-        canonical = _row_to_canonical(item)
-        if canonical is None:
-            continue
-        batch.append(canonical.to_load_dict())
-        count += 1
-        if len(batch) >= batch_size:
-            yield batch
-            batch = []
-    if batch:
-        yield batch
+    # Fixed-size output buffer filled by index (no list growth while a batch fills up).
+    batch: List[Any] = [None] * batch_size
+    idx = 0
+    # One clock read per yielded batch, not per row.
+    ingested_at = datetime.now(timezone.utc).isoformat()
+    for table in ds.with_format("arrow").iter(batch_size=batch_size):
+        mask = _domain_mask(table)
+        date_mask = _date_mask(table, cutoff)
+        if date_mask is not None:
+            mask = pc.and_(mask, date_mask)
+        for item in table.filter(mask).to_pylist():
+            posted = _parse_date(item.get("job_posted_date"))
+            if posted is None or posted < cutoff:
+                continue
+            batch[idx] = _row_to_load_dict(item, posted, ingested_at)
+            idx += 1
+            if idx == batch_size:
+                count += idx
+                yield batch
+                batch = [None] * batch_size
+                idx = 0
+                ingested_at = datetime.now(timezone.utc).isoformat()
+    if idx:
+        count += idx
+        yield batch[:idx]
     logger.info("Hugging Face data_jobs: yielded %d rows after filters", count)
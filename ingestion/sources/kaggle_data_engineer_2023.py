@@ -1,18 +1,20 @@
 """
-Kaggle Data Engineer 2023: read CSV → map columns → RawJobRow per row (optional skills from taxonomy) → yield batches.
-Flow: download CSV if needed → read in chunks → _row_to_canonical() → batch of to_load_dict().
+Kaggle Data Engineer 2023: read CSV → map columns → job_load_dict per row (optional taxonomy skills) → yield batches.
+Flow: kaggle_stream.stream_kaggle_csv (download, stream CSV blocks) → _chunk_to_rows() per block → batches.
 """
 import logging
 import os
-from datetime import date, datetime
+from datetime import date
 from pathlib import Path
 from typing import Any, Iterator, List, Optional
 
 import pandas as pd
 
 from ingestion.filters import last_3_years
-from ingestion.schema import RawJobRow
-from ingestion.sources.kaggle_download import KAGGLE_BASE, download_dataset
+from ingestion.schema import job_load_dict
+from ingestion.sources.kaggle_download import KAGGLE_BASE, largest_csv, manifest_csv
+from ingestion.sources.kaggle_frames import coalesce_text, frame_records, join_present
+from ingestion.sources.kaggle_stream import KaggleCsvSource, stream_kaggle_csv
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +26,8 @@ SOURCE_ID = "kaggle_data_engineer_2023"
 SOURCE_NAME = "Kaggle Data Engineer Job Postings 2023"
 # No posting date in description; dataset is April 2023
 DEFAULT_POSTED_DATE = date(2023, 4, 1)
+# Every row gets DEFAULT_POSTED_DATE, so the date filter is one check per process, not per row.
+_WITHIN_WINDOW = last_3_years(DEFAULT_POSTED_DATE)
 BATCH_SIZE = 10_000
 
 # Explicit mapping for lukkardata/data-engineer-job-postings-2023 (117-column cleaned format).
@@ -52,10 +56,27 @@ _NORM_TO_CANON = {
 }
 
 
+# Output field -> canonical names it reads (later mapped columns win); "salary_info" columns fill salary_avg.
+_FIELDS: dict[str, tuple[str, ...]] = {
+    "job_title": ("job_title",),
+    "job_description": ("job_description",),
+    "company_name": ("company_name",),
+    "location": ("location",),
+    "location_city": ("location_city",),
+    "location_state": ("location_state",),
+    "location_country": ("location_country",),
+    "salary_avg": ("salary_info", "salary_avg"),
+    "salary_currency": ("salary_currency",),
+}
+
+
+# Spaces and hyphens -> underscores in one str.translate pass.
+_NORM_TABLE = str.maketrans({" ": "_", "-": "_"})
+
+
 def _norm_col(name: str) -> str:
     """Normalize column name for matching: lowercase, spaces to underscores."""
-    s = (name.strip() if isinstance(name, str) else str(name)).lower()
-    return s.replace(" ", "_").replace("-", "_")
+    return (name.strip() if isinstance(name, str) else str(name)).lower().translate(_NORM_TABLE)
 
 
 def _normalize_columns(df: pd.DataFrame) -> dict[str, str]:
@@ -74,81 +95,89 @@ def _normalize_columns(df: pd.DataFrame) -> dict[str, str]:
     return out
 
 
-def _row_to_canonical(row: pd.Series, col_map: dict[str, str]) -> Optional[RawJobRow]:
-    posted = DEFAULT_POSTED_DATE
-    if not last_3_years(posted):
-        return None
+def _chunk_to_rows(
+    chunk: pd.DataFrame,
+    columns: dict[str, List[str]],
+    ingested_at: str,
+) -> List[dict[str, Any]]:
+    """
+    Map a CSV chunk to load dicts column-wise (date window already checked via _WITHIN_WINDOW).
+    columns: columns_by_field(col_map, _FIELDS), resolved once per CSV.
+    """
     # This dataset is 100% Data Engineer postings — skip domain filter
-    title = None
-    desc = None
-    company = None
-    location_city = None
-    location_state = None
-    location_country = None
-    location_single = None
-    salary_avg = None
-    salary_currency = None
-    for csv_col, canon in col_map.items():
-        v = row.get(csv_col)
-        if pd.isna(v):
-            continue
-        s = str(v).strip()
-        if not s:
-            continue
-        if canon == "job_title":
-            title = s
-        elif canon == "job_description":
-            desc = s
-        elif canon == "company_name":
-            company = s
-        elif canon == "location":
-            location_single = s
-        elif canon == "location_city":
-            location_city = s
-        elif canon == "location_state":
-            location_state = s
-        elif canon == "location_country":
-            location_country = s
-        elif canon == "salary_info":
-            salary_avg = s
-        elif canon == "salary_avg":
-            salary_avg = s
-        elif canon == "salary_currency":
-            salary_currency = s
-    location = location_single or ", ".join(
-        filter(None, [location_city, location_state, location_country])
-    ) or None
-    salary_info = None
-    if salary_avg or salary_currency:
-        salary_info = " ".join(filter(None, [salary_avg, salary_currency]))
-    skills: Optional[List[str]] = None
+
+    def text(field: str) -> pd.Series:
+        return coalesce_text(chunk, columns[field], skip_blank=True)
+
+    title = text("job_title")
+    desc = text("job_description")
+    location_single = text("location")
+    joined_location = join_present([text("location_city"), text("location_state"), text("location_country")], ", ")
+    sub = pd.DataFrame(
+        {
+            "job_title": title,
+            "job_description": desc,
+            "company_name": text("company_name"),
+            "location": location_single.where(location_single.notna(), pd.Series(joined_location, index=chunk.index)),
+            "salary_info": join_present([text("salary_avg"), text("salary_currency")], " "),
+        },
+        index=chunk.index,
+    )
     if EXTRACT_SKILLS_TAXONOMY:
         from ingestion.skills_extraction import extract_skills_taxonomy
         # Extract from job description (primary) and job title using curated taxonomy
-        skills = extract_skills_taxonomy(title, desc) or None
-    return RawJobRow(
-        source_id=SOURCE_ID,
-        source_name=SOURCE_NAME,
-        job_title=title,
-        job_description=desc,
-        company_name=company,
-        location=location,
-        posted_date=posted,
-        job_url=None,
-        skills=skills,
-        salary_info=salary_info,
-        ingested_at=datetime.now(),
-    )
-
-
-def _find_csvs(directory: Path) -> List[Path]:
-    return sorted(directory.rglob("*.csv"), key=lambda p: p.stat().st_size, reverse=True)
-
-
-def _find_best_csv(directory: Path) -> Optional[Path]:
-    """Return the largest CSV (by file size) so we prefer the main data file over small metadata CSVs."""
-    csvs = _find_csvs(directory)
-    return csvs[0] if csvs else None
+        sub["skills"] = [extract_skills_taxonomy(t, d) or None for t, d in zip(title, desc)]
+    else:
+        sub["skills"] = None
+    return [
+        job_load_dict(
+            source_id=SOURCE_ID,
+            source_name=SOURCE_NAME,
+            posted_date=DEFAULT_POSTED_DATE,
+            job_url=None,
+            ingested_at=ingested_at,
+            **rec,
+        )
+        for rec in frame_records(sub)
+    ]
+
+
+def _infer_column_map(header: pd.DataFrame) -> dict[str, str]:
+    """_normalize_columns, then substring matches for canonical fields still unmapped."""
+    col_map = _normalize_columns(header)
+    vals = set(col_map.values())
+    # Fallback: match by substring so "Job Title", "job_title_clean", etc. map
+    for c in header.columns:
+        if c in col_map:
+            continue
+        n = _norm_col(c)
+        if "job_title" not in vals and "title" in n:
+            col_map[c], vals = "job_title", vals | {"job_title"}
+        elif "job_description" not in vals and ("description" in n or "desc" in n):
+            col_map[c], vals = "job_description", vals | {"job_description"}
+        elif "location" not in vals and ("location" in n or "loc" in n):
+            col_map[c], vals = "location", vals | {"location"}
+        elif "company_name" not in vals and "company" in n:
+            col_map[c], vals = "company_name", vals | {"company_name"}
+        elif "salary_info" not in vals and "salary" in n:
+            col_map[c], vals = "salary_info", vals | {"salary_info"}
+    return col_map
+
+
+def _main_csv(dest: Path) -> Optional[Path]:
+    # download_complete checked the manifest's CSV, so its recorded path is the largest CSV without a walk.
+    # Otherwise the largest CSV: the main data file rather than small metadata CSVs.
+    return manifest_csv(dest) or largest_csv(dest)
+
+
+_SOURCE = KaggleCsvSource(
+    dataset=DATASET,
+    log_name="data_engineer_2023",
+    fields=_FIELDS,
+    column_map=_infer_column_map,
+    chunk_to_rows=_chunk_to_rows,
+    find_csv=_main_csv,
+)
 
 
 def stream_kaggle_data_engineer_2023(
@@ -156,50 +185,10 @@ def stream_kaggle_data_engineer_2023(
     force_download: bool = False,
 ) -> Iterator[List[dict[str, Any]]]:
     """Download if needed, load CSV, filter (last 3 years, data domain), yield batches."""
-    dest = Path(KAGGLE_BASE) / "lukkardata-data-engineer-job-postings-2023"
-    if force_download or not dest.exists():
-        download_dataset(DATASET)
-    csv_path = _find_best_csv(dest)
-    if not csv_path:
-        raise FileNotFoundError(f"No CSV found under {dest}")
-    col_map = None
-    count = 0
-    batch: List[dict[str, Any]] = []
-    for chunk in pd.read_csv(csv_path, chunksize=batch_size, low_memory=False):
-        if col_map is None:
-            col_map = _normalize_columns(chunk)
-            vals = set(col_map.values())
-            # Fallback: match by substring so "Job Title", "job_title_clean", etc. map
-            for c in chunk.columns:
-                if c in col_map:
-                    continue
-                n = _norm_col(c)
-                if "job_title" not in vals and "title" in n:
-                    col_map[c], vals = "job_title", vals | {"job_title"}
-                elif "job_description" not in vals and ("description" in n or "desc" in n):
-                    col_map[c], vals = "job_description", vals | {"job_description"}
-                elif "location" not in vals and ("location" in n or "loc" in n):
-                    col_map[c], vals = "location", vals | {"location"}
-                elif "company_name" not in vals and "company" in n:
-                    col_map[c], vals = "company_name", vals | {"company_name"}
-                elif "salary_info" not in vals and "salary" in n:
-                    col_map[c], vals = "salary_info", vals | {"salary_info"}
-            logger.info(
-                "Kaggle data_engineer_2023: CSV %s has %d columns, mapped %d (sample: %s)",
-                csv_path.name,
-                len(chunk.columns),
-                len(col_map),
-                list(col_map.keys())[:8],
-            )
-        for _, row in chunk.iterrows():
-            canonical = _row_to_canonical(row, col_map)
-            if canonical is None:
-                continue
-            batch.append(canonical.to_load_dict())
-            count += 1
-            if len(batch) >= batch_size:
-                yield batch
-                batch = []
-    if batch:
-        yield batch
-    logger.info("Kaggle data_engineer_2023: yielded %d rows after filters", count)
+    if not _WITHIN_WINDOW:
+        logger.info(
+            "Kaggle data_engineer_2023: DEFAULT_POSTED_DATE %s is before the cutoff; nothing to load",
+            DEFAULT_POSTED_DATE,
+        )
+        return
+    yield from stream_kaggle_csv(_SOURCE, KAGGLE_BASE, batch_size=batch_size, force_download=force_download)
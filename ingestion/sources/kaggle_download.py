@@ -1,15 +1,23 @@
 """Shared Kaggle API download: unzip into data/kaggle/<slug>/."""
+import hashlib
+import json
 import logging
 import os
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Any, Iterator, List, Optional
 
 from kaggle.api.kaggle_api_extended import KaggleApi
 
+from ingestion.sources.csv_stream import csv_to_parquet
+
 logger = logging.getLogger(__name__)
 
 # Default base dir for Kaggle downloads (mount point in Docker: /app/data)
 KAGGLE_BASE = os.environ.get("KAGGLE_DATA_PATH", os.path.join(os.getcwd(), "data", "kaggle"))
+# Written last by download_dataset: a dataset directory without it (e.g. interrupted download) is downloaded again.
+MANIFEST_NAME = ".horizon_manifest.json"
+_HASH_BLOCK = 1 << 20
 
 
 def ensure_kaggle_credentials() -> None:
@@ -23,6 +31,85 @@ def ensure_kaggle_credentials() -> None:
         )
 
 
+def _sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(_HASH_BLOCK), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _scan_csvs(directory: str) -> Iterator[os.DirEntry]:
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _scan_csvs(entry.path)
+            elif entry.name.endswith(".csv") and entry.is_file():
+                yield entry
+
+
+def csvs_by_size(directory: Path) -> List[Path]:
+    """Every CSV under directory, largest first (one scandir walk; DirEntry caches each file's stat)."""
+    if not directory.is_dir():
+        return []
+    entries = sorted(_scan_csvs(str(directory)), key=lambda e: e.stat().st_size, reverse=True)
+    return [Path(e.path) for e in entries]
+
+
+def largest_csv(directory: Path) -> Optional[Path]:
+    """The largest CSV under directory (first found on ties), in one scandir pass; None if there is none."""
+    if not directory.is_dir():
+        return None
+    best = max(_scan_csvs(str(directory)), key=lambda e: e.stat().st_size, default=None)
+    return Path(best.path) if best else None
+
+
+def write_manifest(dest: Path) -> Optional[dict[str, Any]]:
+    """Record the largest CSV under dest (relative path, size, SHA-256) in dest/MANIFEST_NAME; None if no CSV."""
+    csvs = csvs_by_size(dest)
+    if not csvs:
+        logger.warning("No CSV under %s; not writing %s", dest, MANIFEST_NAME)
+        return None
+    main = csvs[0]
+    manifest = {
+        "csv_path": main.relative_to(dest).as_posix(),
+        "size": main.stat().st_size,
+        "sha256": _sha256(main),
+        "ts": datetime.now(timezone.utc).isoformat(),
+    }
+    tmp_path = dest / (MANIFEST_NAME + ".tmp")
+    tmp_path.write_text(json.dumps(manifest, indent=2))
+    os.replace(tmp_path, dest / MANIFEST_NAME)
+    return manifest
+
+
+def read_manifest(dest: Path) -> Optional[dict[str, Any]]:
+    """The manifest written by download_dataset, or None if it is missing or unreadable."""
+    try:
+        return json.loads((dest / MANIFEST_NAME).read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def manifest_csv(dest: Path) -> Optional[Path]:
+    """The largest CSV as recorded in dest's manifest (no directory walk), or None without a manifest."""
+    manifest = read_manifest(dest)
+    if not manifest or "csv_path" not in manifest:
+        return None
+    return dest / manifest["csv_path"]
+
+
+def download_complete(dest: Path) -> bool:
+    """True if dest holds a finished download: manifest present and its CSV still has the recorded size."""
+    manifest = read_manifest(dest)
+    if not manifest:
+        return False
+    try:
+        return (dest / manifest["csv_path"]).stat().st_size == manifest["size"]
+    except (KeyError, TypeError, OSError):
+        return False
+
+
 def download_dataset(dataset: str, path: Optional[str] = None, unzip: bool = True) -> Path:
     """
     Download a Kaggle dataset (e.g. 'lukkardata/data-engineer-job-postings-2023').
@@ -36,4 +123,13 @@ def download_dataset(dataset: str, path: Optional[str] = None, unzip: bool = Tru
     api.authenticate()
     logger.info("Downloading Kaggle dataset %s to %s", dataset, dest)
     api.dataset_download_files(dataset, path=dest, unzip=unzip, quiet=False)
+    if unzip:
+        # Columnar copy of every CSV, so later runs skip CSV parsing (see csv_stream.iter_csv_frames). The copy is
+        # only an optimization: a CSV pyarrow cannot transcode is still read from the CSV, and the manifest is written.
+        for csv_path in Path(dest).rglob("*.csv"):
+            try:
+                csv_to_parquet(csv_path)
+            except Exception as e:
+                logger.warning("No Parquet copy of %s (reading the CSV instead): %s", csv_path, e)
+        write_manifest(Path(dest))
     return Path(dest)
@@ -0,0 +1,147 @@
+"""
+Column-wise helpers shared by the Kaggle CSV sources: a whole pandas chunk is mapped to canonical columns at once
+(no iterrows / per-row Series), reproducing the per-row "last mapped column with a value wins" rules.
+"""
+from typing import Any, Iterable, Iterator, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+# Every character str.isspace() accepts, i.e. exactly what str.strip() removes.
+PY_WHITESPACE = (
+    "\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007"
+    "\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000"
+)
+
+
+def mapped_columns(col_map: dict[str, str], *canon: str) -> List[str]:
+    """CSV columns mapped to any of the canonical names, in col_map order (later columns win)."""
+    return [c for c, name in col_map.items() if name in canon]
+
+
+def columns_by_field(col_map: dict[str, str], fields: dict[str, Sequence[str]]) -> dict[str, List[str]]:
+    """Resolve once per CSV: field -> CSV columns mapped to any of its canonical names (col_map order)."""
+    return {field: mapped_columns(col_map, *canon) for field, canon in fields.items()}
+
+
+def _none_for_missing(s: pd.Series) -> pd.Series:
+    """Object Series with None (not NaN) for missing values."""
+    s = s.astype(object)
+    return s.where(s.notna(), None)
+
+
+def _stripped_text(col: pd.Series) -> pa.Array:
+    """str(v).strip() per cell as an Arrow string array (null where the cell is NA)."""
+    if pd.api.types.is_string_dtype(col.dtype) and col.dtype != object:
+        # String columns (what csv_stream yields): trim in Arrow's C kernel, same characters as str.strip().
+        return pc.utf8_trim(pa.array(col, type=pa.string(), from_pandas=True), characters=PY_WHITESPACE)
+    text = col.map(str, na_action="ignore").astype(object).str.strip()
+    return pa.array(text, type=pa.string(), from_pandas=True)
+
+
+def coalesce_text(chunk: pd.DataFrame, cols: Sequence[str], *, skip_blank: bool) -> pd.Series:
+    """
+    str(v).strip() from the last of cols with a value in each row; None when there is none.
+    skip_blank: whitespace-only cells do not count as a value (otherwise they win as "").
+    """
+    texts = []
+    for c in cols:
+        text = _stripped_text(chunk[c])
+        if skip_blank:
+            text = pc.if_else(pc.equal(text, ""), pa.scalar(None, pa.string()), text)
+        texts.append(text)
+    if not texts:
+        return pd.Series([None] * len(chunk), index=chunk.index, dtype=object)
+    # coalesce takes the first non-null, so reverse: the last mapped column wins.
+    out = pc.coalesce(*reversed(texts)) if len(texts) > 1 else texts[0]
+    return pd.Series(out.to_numpy(zero_copy_only=False), index=chunk.index, dtype=object)
+
+
+def split_skills(
+    chunk: pd.DataFrame,
+    cols: Sequence[str],
+    *,
+    separators: str,
+    trigger: str,
+    remove: Optional[str] = None,
+) -> pa.ListArray:
+    """
+    Skills lists from the last of cols that is not NA (string columns, as csv_stream yields), in Arrow kernels.
+    Cells matching the trigger regex lose the remove matches and are split on the separators regex; other cells
+    are one skill. Items are str.strip()'d and empty ones dropped. Null when the cell is missing, or blank and
+    not triggered; a triggered cell without items gives [].
+    """
+    arrays = [pa.array(chunk[c], type=pa.string(), from_pandas=True) for c in cols]
+    if not arrays:
+        return pa.nulls(len(chunk), pa.list_(pa.string()))
+    values = pc.coalesce(*reversed(arrays)) if len(arrays) > 1 else arrays[0]
+    triggered = pc.fill_null(pc.match_substring_regex(values, trigger), False)
+    if remove is not None:
+        values = pc.if_else(triggered, pc.replace_substring_regex(values, remove, ""), values)
+    # Cells that are not triggered hold no separator, so the split leaves them whole.
+    parts = pc.split_pattern_regex(values, separators)
+    items = pc.utf8_trim(pc.list_flatten(parts), characters=PY_WHITESPACE)
+    present = pc.not_equal(items, "")
+    counts = np.bincount(
+        pc.list_parent_indices(parts).filter(present).to_numpy(),
+        minlength=len(values),
+    )
+    offsets = np.zeros(len(values) + 1, dtype=np.int32)
+    np.cumsum(counts, out=offsets[1:])
+    missing = pc.or_(pc.is_null(values), pc.and_(pc.invert(triggered), pa.array(counts == 0)))
+    return pa.ListArray.from_arrays(pa.array(offsets), items.filter(present), mask=missing)
+
+
+def joined_skills(skills: pa.ListArray) -> pa.Array:
+    """Skills joined with spaces for filters.data_domain_mask; null for a null or empty list."""
+    text = pc.binary_join(skills, " ")
+    return pc.if_else(pc.equal(text, ""), pa.scalar(None, pa.string()), text)
+
+
+def blank_to_none(s: pd.Series) -> pd.Series:
+    """'' -> None (the per-row `str(v).strip() or None`)."""
+    return s.where(s != "", None)
+
+
+def join_present(cols: Iterable[pd.Series], sep: str) -> List[Optional[str]]:
+    """Per row, sep.join of the non-empty values (None when every value is missing)."""
+    return [sep.join(filter(None, parts)) or None for parts in zip(*cols)]
+
+
+def arrow_text(s: pd.Series) -> pa.Array:
+    """Object Series of str and None/NaN as an Arrow string array (for filters.data_domain_mask)."""
+    return pa.array(s, type=pa.string(), from_pandas=True)
+
+
+def frame_records(frame: pd.DataFrame) -> List[dict[str, Any]]:
+    """
+    Row dicts with None for missing values. Plain tuples zipped with the column names: ~3x faster than
+    to_dict(orient="records"), which re-boxes every value.
+    """
+    names = list(frame.columns)
+    values = frame.astype(object).where(frame.notna(), None)
+    return [dict(zip(names, row)) for row in values.itertuples(index=False, name=None)]
+
+
+def rebatch(chunks: Iterable[List[Any]], batch_size: int) -> Iterator[List[Any]]:
+    """
+    Re-cut per-chunk row lists into batches of exactly batch_size (the last may be shorter). Each batch is
+    preallocated and filled by slice assignment, so the buffered tail is never re-copied.
+    """
+    batch: List[Any] = [None] * batch_size
+    fill = 0
+    for rows in chunks:
+        start = 0
+        while start < len(rows):
+            take = min(batch_size - fill, len(rows) - start)
+            batch[fill : fill + take] = rows[start : start + take]
+            fill += take
+            start += take
+            if fill == batch_size:
+                yield batch
+                batch = [None] * batch_size
+                fill = 0
+    if fill:
+        yield batch[:fill]
@@ -6,9 +6,20 @@ from typing import Any, Iterator, List, Optional
 
 import pandas as pd
 
-from ingestion.filters import data_domain_only, last_3_years
-from ingestion.schema import RawJobRow
-from ingestion.sources.kaggle_download import KAGGLE_BASE, download_dataset
+from ingestion.config import CUTOFF_DATE
+from ingestion.filters import data_domain_mask
+from ingestion.schema import job_load_dict
+from ingestion.sources.csv_stream import infer_numeric
+from ingestion.sources.kaggle_download import KAGGLE_BASE
+from ingestion.sources.kaggle_frames import (
+    arrow_text,
+    blank_to_none,
+    coalesce_text,
+    frame_records,
+    joined_skills,
+    split_skills,
+)
+from ingestion.sources.kaggle_stream import KaggleCsvSource, stream_kaggle_csv
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +29,21 @@ SOURCE_NAME = "Kaggle 1.3M LinkedIn Jobs & Skills 2024"
 DEFAULT_POSTED_DATE = date(2024, 1, 1)
 BATCH_SIZE = 10_000
 
+# Output field -> canonical name it reads, resolved to CSV columns once per file (columns_by_field).
+_FIELDS: dict[str, tuple[str, ...]] = {
+    name: (name,)
+    for name in (
+        "job_title",
+        "job_description",
+        "company_name",
+        "location",
+        "posted_date",
+        "job_url",
+        "skills",
+        "salary_info",
+    )
+}
+
 
 def _infer_column_map(df: pd.DataFrame) -> dict[str, str]:
     """Infer CSV column -> canonical from common names."""
@@ -44,84 +70,79 @@ def _infer_column_map(df: pd.DataFrame) -> dict[str, str]:
 
 
 def _parse_date(val: Any) -> Optional[date]:
-    if val is None or (isinstance(val, float) and pd.isna(val)):
+    if val is None or (isinstance(val, float) and val != val):  # None / NaN
         return None
     if isinstance(val, date) and not isinstance(val, datetime):
         return val
     if isinstance(val, datetime):
         return val.date()
+    if isinstance(val, str):
+        # ISO-8601 (the usual case) via the C parser; anything else still goes through pandas.
+        try:
+            return datetime.fromisoformat(val).date()
+        except ValueError:
+            pass
     try:
         return pd.to_datetime(val).date()
     except Exception:
         return None
 
 
-def _skills_to_list(val: Any) -> Optional[List[str]]:
-    if val is None or (isinstance(val, float) and pd.isna(val)):
-        return None
-    if isinstance(val, list):
-        return [str(x) for x in val]
-    if isinstance(val, str):
-        if ";" in val or "|" in val or "," in val:
-            return [x.strip() for x in val.replace(";", "|").replace(",", "|").split("|") if x and x.strip()]
-        return [val.strip()] if val.strip() else None
-    return None
-
-
-def _row_to_canonical(row: pd.Series, col_map: dict[str, str]) -> Optional[RawJobRow]:
-    posted = DEFAULT_POSTED_DATE
-    for csv_col, canon in col_map.items():
-        if canon == "posted_date":
-            v = _parse_date(row.get(csv_col))
-            if v:
-                posted = v
-            break
-    if not last_3_years(posted):
-        return None
-    title = None
-    desc = None
-    skills = None
-    for csv_col, canon in col_map.items():
-        v = row.get(csv_col)
-        if pd.isna(v):
-            continue
-        if canon == "job_title":
-            title = str(v).strip() or None
-        elif canon == "job_description":
-            desc = str(v).strip() or None
-        elif canon == "skills":
-            skills = _skills_to_list(v)
-    if not data_domain_only(title=title, description=desc, skills=skills):
-        return None
-    company = None
-    location = None
-    salary_info = None
-    job_url = None
-    for csv_col, canon in col_map.items():
-        v = row.get(csv_col)
-        if pd.isna(v):
-            continue
-        if canon == "company_name":
-            company = str(v).strip()
-        elif canon == "location":
-            location = str(v).strip()
-        elif canon == "salary_info":
-            salary_info = str(v).strip()
-        elif canon == "job_url":
-            job_url = str(v).strip()
-    return RawJobRow(
-        source_id=SOURCE_ID,
-        source_name=SOURCE_NAME,
-        job_title=title,
-        job_description=desc,
-        company_name=company,
-        location=location,
-        posted_date=posted,
-        job_url=job_url,
-        skills=skills,
-        salary_info=salary_info,
-        ingested_at=datetime.now(),
+def _parse_dates(values: pd.Series) -> pd.Series:
+    """_parse_date per distinct value (posting dates repeat a lot), mapped back onto the column."""
+    parsed = {v: _parse_date(v) for v in values.dropna().unique()}
+    return values.map(parsed)
+
+
+def _chunk_to_rows(
+    chunk: pd.DataFrame,
+    columns: dict[str, List[str]],
+    ingested_at: str,
+) -> List[dict[str, Any]]:
+    """
+    Map a CSV chunk to load dicts column-wise: date and domain filters are boolean masks over the chunk, and
+    the remaining fields are only built for rows that pass. columns: columns_by_field(col_map, _FIELDS).
+    """
+    if columns["posted_date"]:
+        # Only the first posted_date column counts; unparseable/missing -> DEFAULT_POSTED_DATE. Numeric columns
+        # are parsed as numbers, as they were when pandas inferred the column type.
+        posted = _parse_dates(infer_numeric(chunk[columns["posted_date"][0]]))
+        posted = posted.where(posted.notna(), DEFAULT_POSTED_DATE)
+    else:
+        posted = pd.Series(DEFAULT_POSTED_DATE, index=chunk.index, dtype=object)
+    keep = (posted >= CUTOFF_DATE).to_numpy(dtype=bool)
+    if not keep.any():
+        return []
+    chunk = chunk[keep]
+
+    def text(field: str) -> pd.Series:
+        return coalesce_text(chunk, columns[field], skip_blank=False)
+
+    title = blank_to_none(text("job_title"))
+    desc = blank_to_none(text("job_description"))
+    skills = split_skills(chunk, columns["skills"], separators=r"[;|,]", trigger=r"[;|,]")
+    domain = data_domain_mask(title=arrow_text(title), description=arrow_text(desc), skills=joined_skills(skills))
+    keep = domain.to_numpy(zero_copy_only=False)
+    if not keep.any():
+        return []
+    chunk = chunk[keep]
+    sub = pd.DataFrame(
+        {
+            "job_title": title[keep],
+            "job_description": desc[keep],
+            "company_name": text("company_name"),
+            "location": text("location"),
+            "posted_date": posted[chunk.index],
+            "job_url": text("job_url"),
+            "skills": pd.Series(skills.filter(keep).to_pylist(), index=chunk.index, dtype=object),
+            "salary_info": text("salary_info"),
+        },
+        index=chunk.index,
     )
+    return [
+        job_load_dict(source_id=SOURCE_ID, source_name=SOURCE_NAME, ingested_at=ingested_at, **rec)
+        for rec in frame_records(sub)
+    ]
 
 
 def _find_first_csv(directory: Path) -> Optional[Path]:
@@ -130,32 +151,19 @@ def _find_first_csv(directory: Path) -> Optional[Path]:
     return None
 
 
+_SOURCE = KaggleCsvSource(
+    dataset=DATASET,
+    log_name="linkedin_jobs_skills_2024",
+    fields=_FIELDS,
+    column_map=_infer_column_map,
+    chunk_to_rows=_chunk_to_rows,
+    find_csv=_find_first_csv,
+)
+
+
 def stream_kaggle_linkedin_jobs_skills_2024(
     batch_size: int = BATCH_SIZE,
     force_download: bool = False,
 ) -> Iterator[List[dict[str, Any]]]:
     """Download if needed, load CSV, filter (last 3 years, data domain), yield batches."""
-    dest = Path(KAGGLE_BASE) / "asaniczka-1-3m-linkedin-jobs-and-skills-2024"
-    if force_download or not dest.exists():
-        download_dataset(DATASET)
-    csv_path = _find_first_csv(dest)
-    if not csv_path:
-        raise FileNotFoundError(f"No CSV found under {dest}")
-    col_map: Optional[dict[str, str]] = None
-    count = 0
-    batch: List[dict[str, Any]] = []
-    for chunk in pd.read_csv(csv_path, chunksize=batch_size, low_memory=False):
-        if col_map is None:
-            col_map = _infer_column_map(chunk)
-        for _, row in chunk.iterrows():
-            canonical = _row_to_canonical(row, col_map)
-            if canonical is None:
-                continue
-            batch.append(canonical.to_load_dict())
-            count += 1
-            if len(batch) >= batch_size:
-                yield batch
-                batch = []
-    if batch:
-        yield batch
-    logger.info("Kaggle linkedin_jobs_skills_2024: yielded %d rows after filters", count)
+    yield from stream_kaggle_csv(_SOURCE, KAGGLE_BASE, batch_size=batch_size, force_download=force_download)
@@ -0,0 +1,73 @@
+"""
+Shared driver for the Kaggle CSV sources: download if needed → pick the CSV → map columns from the header → stream
+the mapped columns block by block → per-source chunk mapper (optionally in worker processes) → fixed-size batches.
+Source modules only declare a KaggleCsvSource, so changes to the loop land here once for all of them.
+"""
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterator, List, Mapping, Optional, Sequence
+
+import pandas as pd
+
+from ingestion.sources.csv_stream import csv_header, iter_csv_frames, map_chunks
+from ingestion.sources.kaggle_download import download_complete, download_dataset
+from ingestion.sources.kaggle_frames import columns_by_field, rebatch
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class KaggleCsvSource:
+    """
+    One Kaggle dataset and how its CSV maps to canonical rows. The callables must be module-level functions:
+    chunk_to_rows(chunk, columns, ingested_at) may run in a worker process (csv_stream.map_chunks).
+    """
+
+    dataset: str  # Kaggle ref, e.g. "arshkon/linkedin-job-postings"; downloaded to KAGGLE_BASE/<owner>-<name>
+    log_name: str
+    fields: Mapping[str, Sequence[str]]  # output field -> canonical names it reads (kaggle_frames.columns_by_field)
+    column_map: Callable[[pd.DataFrame], dict[str, str]]  # header-only DataFrame -> CSV column -> canonical
+    chunk_to_rows: Callable[[pd.DataFrame, dict[str, List[str]], str], List[dict[str, Any]]]
+    find_csv: Callable[[Path], Optional[Path]]
+
+    @property
+    def slug(self) -> str:
+        return self.dataset.replace("/", "-")
+
+
+def stream_kaggle_csv(
+    source: KaggleCsvSource,
+    base: str,
+    *,
+    batch_size: int,
+    force_download: bool = False,
+) -> Iterator[List[dict[str, Any]]]:
+    """Download source under base if needed, stream its CSV through chunk_to_rows, yield batches of load dicts."""
+    dest = Path(base) / source.slug
+    if force_download or not download_complete(dest):
+        download_dataset(source.dataset)
+    csv_path = source.find_csv(dest)
+    if not csv_path:
+        raise FileNotFoundError(f"No CSV found under {dest}")
+    # Map columns from the header alone, then stream only the mapped columns (as strings) through pyarrow.
+    header = pd.DataFrame(columns=csv_header(csv_path))
+    col_map = source.column_map(header)
+    logger.info(
+        "Kaggle %s: CSV %s has %d columns, mapped %d (sample: %s)",
+        source.log_name,
+        csv_path.name,
+        len(header.columns),
+        len(col_map),
+        list(col_map.keys())[:8],
+    )
+    count = 0
+    # One ingestion timestamp for the whole run, serialized once (not per row).
+    ingested_at = datetime.now(timezone.utc).isoformat()
+    frames = iter_csv_frames(csv_path, list(col_map))
+    columns = columns_by_field(col_map, dict(source.fields))
+    for batch in rebatch(map_chunks(source.chunk_to_rows, frames, columns, ingested_at), batch_size):
+        count += len(batch)
+        yield batch
+    logger.info("Kaggle %s: yielded %d rows after filters", source.log_name, count)
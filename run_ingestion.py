@@ -6,17 +6,20 @@ Flow: CLI → pick runner by --source → run_pipeline() → stream_*() yields b
 Step 2: run scripts/load_gcs_to_bigquery.py to load GCS → BigQuery.
 
 Usage:
-  python run_ingestion.py --source all
+  python run_ingestion.py --source all                    # sources run concurrently; add --sequential for one at a time
   python run_ingestion.py --source kaggle_data_engineer   # or huggingface, kaggle_linkedin, kaggle_linkedin_skills
 
 Requires: GCS_BUCKET, GOOGLE_CLOUD_PROJECT (or GCP_PROJECT). Kaggle: KAGGLE_USERNAME, KAGGLE_KEY.
 """
 import argparse
+import importlib
 import logging
 import os
 import sys
+import threading
 
 from ingestion.env_bootstrap import load_dotenv_repo
+from ingestion.pipelines.run_all import PIPELINE_MODULES, run_all, run_one
 
 load_dotenv_repo(override=True, search_cwd=True)
 
@@ -27,32 +30,26 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-SOURCES = [
-    "huggingface",
-    "kaggle_data_engineer",
-    "kaggle_linkedin",
-    "kaggle_linkedin_skills",
-]
+SOURCES = list(PIPELINE_MODULES)
+# Imported by every pipeline; loading them takes seconds, so it overlaps with the env checks.
+WARMUP_MODULES = ("pandas", "pyarrow", "dlt")
 
 
-def run_huggingface() -> None:
-    from ingestion.pipelines.run_huggingface import run
-    run()
-
-
-def run_kaggle_data_engineer() -> None:
-    from ingestion.pipelines.run_kaggle_data_engineer import run
-    run()
-
-
-def run_kaggle_linkedin() -> None:
-    from ingestion.pipelines.run_kaggle_linkedin import run
-    run()
+def _warm_imports() -> None:
+    for module in WARMUP_MODULES:
+        try:
+            importlib.import_module(module)
+        except ImportError:
+            pass  # the pipeline that needs it reports the error
 
 
-def run_kaggle_linkedin_skills() -> None:
-    from ingestion.pipelines.run_kaggle_linkedin_skills import run
-    run()
+def _required_env() -> dict[str, str]:
+    """GCS_BUCKET and the GCP project in one pass; a key is missing when its variable is unset."""
+    env = {
+        "GCS_BUCKET": os.environ.get("GCS_BUCKET"),
+        "GOOGLE_CLOUD_PROJECT": os.environ.get("GOOGLE_CLOUD_PROJECT") or os.environ.get("GCP_PROJECT"),
+    }
+    return {k: v for k, v in env.items() if v}
 
 
 def main() -> int:
@@ -65,12 +62,20 @@ def main() -> int:
         default="all",
         help="Which source(s) to run. Default: all.",
     )
+    parser.add_argument(
+        "--sequential",
+        action="store_true",
+        help="Run sources one at a time and stop at the first failure (default: all sources concurrently).",
+    )
     args = parser.parse_args()
+    warmup = threading.Thread(target=_warm_imports, name="import-warmup", daemon=True)
+    warmup.start()
 
-    if not os.environ.get("GCS_BUCKET"):
+    env = _required_env()
+    if "GCS_BUCKET" not in env:
         logger.error("GCS_BUCKET is required for dlt → GCS. Set it or use .env (see .env.example).")
         return 1
-    if not (os.environ.get("GOOGLE_CLOUD_PROJECT") or os.environ.get("GCP_PROJECT")):
+    if "GOOGLE_CLOUD_PROJECT" not in env:
         logger.error("GOOGLE_CLOUD_PROJECT (or GCP_PROJECT) is required. Set it or use .env.")
         return 1
 
@@ -78,22 +83,24 @@ def main() -> int:
         to_run = SOURCES
     else:
         to_run = [args.source]
-
-    runners = {
-        "huggingface": run_huggingface,
-        "kaggle_data_engineer": run_kaggle_data_engineer,
-        "kaggle_linkedin": run_kaggle_linkedin,
-        "kaggle_linkedin_skills": run_kaggle_linkedin_skills,
-    }
-
-    for name in to_run:
-        logger.info("Starting pipeline: %s", name)
-        try:
-            runners[name]()
-            logger.info("Completed pipeline: %s", name)
-        except Exception as e:
-            logger.exception("Pipeline %s failed: %s", name, e)
-            return 1
+    # Finish the shared imports before pipeline threads import the same modules.
+    warmup.join()
+
+    if args.sequential:
+        for name in to_run:
+            try:
+                run_one(name)
+                logger.info("Completed pipeline: %s", name)
+            except Exception as e:
+                logger.exception("Pipeline %s failed: %s", name, e)
+                return 1
+        return 0
+
+    # Sources are independent and I/O-bound (downloads, GCS writes): run them in threads, wall time ~ slowest one.
+    failures = run_all(to_run, max_workers=len(to_run))
+    if failures:
+        logger.error("Failed pipelines: %s", ", ".join(sorted(failures)))
+        return 1
     return 0
 
 
@@ -14,7 +14,8 @@ Requires GOOGLE_API_KEY or GEMINI_API_KEY for LLM extraction. For CSV, KAGGLE_US
 """
 
 import argparse
-import csv
+import asyncio
+import functools
 import logging
 import os
 import sys
@@ -31,10 +32,21 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=4096)
+def _norm(skill: str) -> str:
+    """Skill key for comparison; memoized (the same skills repeat across rows), "" for blank."""
+    return sys.intern(skill.strip().lower())
+
+
+def _skill_set(skills: list[str]) -> frozenset[str]:
+    """Normalized, non-blank skills of one list."""
+    return frozenset(n for n in map(_norm, filter(None, skills)) if n)
+
+
 def _jaccard(a: list[str], b: list[str]) -> float:
     """Jaccard similarity between two skill lists (set intersection / set union)."""
-    sa = set(s.strip().lower() for s in a if s and s.strip())
-    sb = set(s.strip().lower() for s in b if s and s.strip())
+    sa = _skill_set(a)
+    sb = _skill_set(b)
     if not sa and not sb:
         return 1.0
     if not sa or not sb:
@@ -45,36 +57,34 @@ def _jaccard(a: list[str], b: list[str]) -> float:
 def _load_sample_from_csv(sample_size: int) -> list[tuple[int, Optional[str], Optional[str]]]:
     """Load sample (row_id, title, description) from Kaggle DE CSV.
     Uses existing data/kaggle/... if present (no Kaggle auth). Only imports Kaggle API when download is needed.
+    Only the title/description columns are parsed (pyarrow), and reading stops once sample_size rows are found.
     """
+    from contextlib import closing
+
     import pandas as pd
+    from ingestion.sources.csv_stream import csv_header, iter_csv_frames
+    from ingestion.sources.kaggle_download import largest_csv
 
     kaggle_base = os.environ.get("KAGGLE_DATA_PATH", os.path.join(os.getcwd(), "data", "kaggle"))
     dest = Path(kaggle_base) / "lukkardata-data-engineer-job-postings-2023"
-    csv_path = None
-    if dest.exists():
-        csvs = sorted(dest.rglob("*.csv"), key=lambda p: p.stat().st_size, reverse=True)
-        csv_path = csvs[0] if csvs else None
+    csv_path = largest_csv(dest)
 
     if not csv_path:
         logger.info("Dataset not found locally. Downloading via Kaggle API (requires kaggle.json or KAGGLE_USERNAME + KAGGLE_KEY) ...")
-        from ingestion.sources.kaggle_data_engineer_2023 import (
-            DATASET,
-            KAGGLE_BASE,
-            _find_best_csv,
-            _norm_col,
-            _normalize_columns,
-        )
+        from ingestion.sources.kaggle_data_engineer_2023 import DATASET, _normalize_columns
         from ingestion.sources.kaggle_download import download_dataset
 
         download_dataset(DATASET)
-        csv_path = _find_best_csv(dest)
+        csv_path = largest_csv(dest)
         if not csv_path:
             raise FileNotFoundError(f"No CSV under {dest}")
-        col_map = _normalize_columns(pd.read_csv(csv_path, nrows=1, low_memory=False))
+        map_columns = _normalize_columns
     else:
-        col_map = None
+        map_columns = None
 
-    df = pd.read_csv(csv_path, nrows=sample_size * 3, low_memory=False)
+    # Read the header once: it picks the columns (and feeds the column map after a download); then parse just those.
+    df = pd.DataFrame(columns=csv_header(csv_path))
+    col_map = map_columns(df) if map_columns else None
     if col_map is None:
         title_col = "Job_details" if "Job_details" in df.columns else df.columns[0]
         description_col = "Job_details.1" if "Job_details.1" in df.columns else (df.columns[1] if len(df.columns) > 1 else None)
@@ -91,19 +101,32 @@ def _load_sample_from_csv(sample_size: int) -> list[tuple[int, Optional[str], Op
         if not description_col:
             description_col = "Job_details.1" if "Job_details.1" in df.columns else None
 
+    def sample_rows(frame: pd.DataFrame) -> list[tuple[int, Optional[str], Optional[str]]]:
+        def stripped(col: Optional[str]) -> pd.Series:
+            # str(v).strip() per cell, blank/missing -> NA
+            if not col:
+                return pd.Series(pd.NA, index=frame.index, dtype="string")
+            text = frame[col].astype("string").str.strip()
+            return text.mask(text == "")
+
+        titles = stripped(title_col)
+        descs = stripped(description_col)
+        mask = (titles.notna() | descs.notna()).to_numpy(dtype=bool)
+
+        def values(s: pd.Series) -> list[Optional[str]]:
+            s = s[mask].astype(object)
+            return s.where(s.notna(), None).tolist()
+
+        return list(zip(frame.index[mask].astype(int).tolist(), values(titles), values(descs)))
+
+    # Stream blocks until enough non-blank rows are collected: memory stays bounded by the block size.
     rows: list[tuple[int, Optional[str], Optional[str]]] = []
-    for idx, row in df.iterrows():
-        if len(rows) >= sample_size:
-            break
-        title = row.get(title_col) if title_col else None
-        desc = row.get(description_col) if description_col else None
-        if pd.isna(title) and pd.isna(desc):
-            continue
-        title_s = str(title).strip() if not pd.isna(title) else None
-        desc_s = str(desc).strip() if not pd.isna(desc) and str(desc).strip() else None
-        if not title_s and not desc_s:
-            continue
-        rows.append((int(idx), title_s or None, desc_s or None))
+    columns = [c for c in (title_col, description_col) if c]
+    with closing(iter_csv_frames(csv_path, columns, block_size=1 << 20)) as frames:
+        for frame in frames:
+            rows.extend(sample_rows(frame))
+            if len(rows) >= sample_size:
+                break
     return rows[:sample_size]
 
 
@@ -113,28 +136,100 @@ def _load_sample_from_bigquery(
     dataset_id: str,
     table_id: str = "raw_kaggle_data_engineer_2023",
 ) -> list[tuple[int, Optional[str], Optional[str]]]:
-    """Load sample (row_id, title, description) from BigQuery table."""
-    from google.cloud import bigquery
+    """
+    Load sample (row_id, title, description) from BigQuery table. The result is fetched as Arrow (over the
+    BigQuery Storage Read API when google-cloud-bigquery-storage is installed) and stripped/filtered column-wise.
+    """
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    from ingestion.bigquery_client import get_client
+    from ingestion.sources.kaggle_frames import PY_WHITESPACE
 
-    client = bigquery.Client(project=project)
+    client = get_client(project)
     query = f"""
-    SELECT job_title, job_description
+    SELECT job_title, CAST(job_description AS STRING) AS job_description
     FROM `{project}.{dataset_id}.{table_id}`
     WHERE (job_title IS NOT NULL AND TRIM(job_title) != '')
        OR (job_description IS NOT NULL AND TRIM(CAST(job_description AS STRING)) != '')
     LIMIT {sample_size}
     """
-    rows: list[tuple[int, Optional[str], Optional[str]]] = []
-    for i, row in enumerate(client.query(query).result()):
-        title = row.job_title.strip() if row.job_title and str(row.job_title).strip() else None
-        desc = row.job_description.strip() if row.job_description and str(row.job_description).strip() else None
-        if not title and not desc:
-            continue
-        rows.append((i, title, desc))
-    return rows
+    table = client.query(query).result().to_arrow(create_bqstorage_client=True)
+
+    def stripped(name: str) -> pa.Array:
+        # str.strip() per value, blank -> null
+        text = pc.utf8_trim(table[name].combine_chunks().cast(pa.string()), characters=PY_WHITESPACE)
+        return pc.if_else(pc.equal(text, ""), pa.scalar(None, pa.string()), text)
+
+    titles = stripped("job_title")
+    descs = stripped("job_description")
+    # Row ids are positions in the query result, as before; rows blank after stripping are dropped.
+    keep = pc.or_(pc.is_valid(titles), pc.is_valid(descs))
+    ids = pa.array(range(len(table)), pa.int64()).filter(keep)
+    return list(zip(ids.to_pylist(), titles.filter(keep).to_pylist(), descs.filter(keep).to_pylist()))
+
+
+# Rows per taxonomy task when the pass runs in a process pool.
+_TAXONOMY_CHUNK = 64
+
+
+def _taxonomy_chunk(rows: list[tuple[int, Optional[str], Optional[str]]]) -> list[list[str]]:
+    """Taxonomy skills for a slice of the sample (module-level so worker processes can run it)."""
+    from ingestion.skills_extraction import extract_skills_taxonomy
+
+    return [extract_skills_taxonomy(title, desc) for _, title, desc in rows]
+
+
+def _taxonomy_results(
+    sample_rows: list[tuple[int, Optional[str], Optional[str]]],
+    workers: int,
+) -> list[list[str]]:
+    """Taxonomy pass in chunks; with workers > 1 the regex matching runs in that many processes, in row order."""
+    from ingestion.sources.csv_stream import map_chunks
+
+    chunks = [sample_rows[i : i + _TAXONOMY_CHUNK] for i in range(0, len(sample_rows), _TAXONOMY_CHUNK)]
+    return [skills for chunk in map_chunks(_taxonomy_chunk, chunks, workers=workers) for skills in chunk]
+
+
+async def _run_extractors(
+    sample_rows: list[tuple[int, Optional[str], Optional[str]]],
+    *,
+    skip_llm: bool,
+    llm_batch_size: int,
+    llm_concurrency: int,
+    max_desc_chars: int,
+    llm_timeout: float,
+    llm_max_output_tokens: int,
+    taxonomy_workers: int,
+) -> tuple[list[list[str]], list[list[str]]]:
+    """Taxonomy (in a worker thread) and LLM batches (concurrent requests) at the same time; both in row order."""
+    from ingestion.skills_extraction import extract_skills_llm_batch_async
+
+    logger.info("Running taxonomy extraction on %d rows (%d worker processes) ...", len(sample_rows), taxonomy_workers)
+    taxonomy = asyncio.to_thread(_taxonomy_results, sample_rows, taxonomy_workers)
+    if skip_llm:
+        logger.info("Skipping LLM extraction (--skip-llm). skills_llm will be empty.")
+        return await taxonomy, [[] for _ in sample_rows]
+    logger.info(
+        "Running LLM (batch) extraction on %d rows, up to %d requests at once ...",
+        len(sample_rows),
+        llm_concurrency,
+    )
+    row_pairs = [(title, desc) for _, title, desc in sample_rows]
+    llm = extract_skills_llm_batch_async(
+        row_pairs,
+        batch_size=llm_batch_size,
+        concurrency=llm_concurrency,
+        max_desc_chars=max_desc_chars,
+        timeout=llm_timeout,
+        max_output_tokens=llm_max_output_tokens,
+    )
+    taxonomy_results, llm_results = await asyncio.gather(taxonomy, llm)
+    return taxonomy_results, llm_results
 
 
 def main() -> int:
+    from ingestion.skills_extraction import LLM_BATCH_DESCRIPTION_CHARS
+
     parser = argparse.ArgumentParser(
         description="Compare taxonomy vs LLM skills extraction on Kaggle DE sample.",
     )
@@ -147,6 +242,31 @@ def main() -> int:
     )
     parser.add_argument("--print-metrics", action="store_true", help="Print summary metrics after writing CSV")
     parser.add_argument("--llm-batch-size", type=int, default=10, help="Batch size for LLM calls (default 10)")
+    parser.add_argument(
+        "--llm-concurrency",
+        type=int,
+        default=4,
+        help="Max LLM batch requests in flight at once (default 4; lower it if you hit rate limits)",
+    )
+    parser.add_argument(
+        "--max-desc-chars",
+        type=int,
+        default=LLM_BATCH_DESCRIPTION_CHARS,
+        help=f"Description characters per job sent to the LLM (default {LLM_BATCH_DESCRIPTION_CHARS})",
+    )
+    parser.add_argument("--llm-timeout", type=float, default=120.0, help="Seconds per LLM request (default 120)")
+    parser.add_argument(
+        "--llm-max-output-tokens",
+        type=int,
+        default=4096,
+        help="Output-token cap per LLM batch request (default 4096)",
+    )
+    parser.add_argument(
+        "--taxonomy-workers",
+        type=int,
+        default=1,
+        help="Processes for the taxonomy pass (default 1 = in-process; a pool only pays off on large samples)",
+    )
     parser.add_argument("--skip-llm", action="store_true", help="Skip LLM extraction (taxonomy only); no API key needed")
     args = parser.parse_args()
 
@@ -166,41 +286,38 @@ def main() -> int:
         logger.error("No rows to compare")
         return 1
 
-    logger.info("Running taxonomy extraction on %d rows ...", len(sample_rows))
-    from ingestion.skills_extraction import extract_skills_taxonomy, extract_skills_llm_batch
-
-    taxonomy_results = [extract_skills_taxonomy(title, desc) for _, title, desc in sample_rows]
-
-    if args.skip_llm:
-        logger.info("Skipping LLM extraction (--skip-llm). skills_llm will be empty.")
-        llm_results = [[] for _ in sample_rows]
-    else:
-        logger.info("Running LLM (batch) extraction on %d rows ...", len(sample_rows))
-        row_pairs = [(title, desc) for _, title, desc in sample_rows]
-        llm_results = extract_skills_llm_batch(row_pairs, batch_size=args.llm_batch_size)
+    taxonomy_results, llm_results = asyncio.run(
+        _run_extractors(
+            sample_rows,
+            skip_llm=args.skip_llm,
+            llm_batch_size=args.llm_batch_size,
+            llm_concurrency=args.llm_concurrency,
+            max_desc_chars=args.max_desc_chars,
+            llm_timeout=args.llm_timeout,
+            llm_max_output_tokens=args.llm_max_output_tokens,
+            taxonomy_workers=args.taxonomy_workers,
+        )
+    )
 
     out_path = Path(args.output)
     out_path.parent.mkdir(parents=True, exist_ok=True)
     snippet_len = 200
 
-    with open(out_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.writer(f)
-        writer.writerow([
-            "row_id", "job_title", "description_snippet", "skills_taxonomy", "skills_llm", "jaccard_similarity",
-        ])
-        for (row_id, title, desc), skills_tax, skills_llm in zip(sample_rows, taxonomy_results, llm_results):
-            desc_snippet = (desc or "")[:snippet_len]
-            if desc and len(desc) > snippet_len:
-                desc_snippet += "..."
-            jaccard = _jaccard(skills_tax, skills_llm)
-            writer.writerow([
-                row_id,
-                title or "",
-                desc_snippet,
-                "|".join(skills_tax) if skills_tax else "",
-                "|".join(skills_llm) if skills_llm else "",
-                f"{jaccard:.4f}",
-            ])
+    import pandas as pd
+
+    descs = [desc or "" for _, _, desc in sample_rows]
+    report = pd.DataFrame(
+        {
+            "row_id": [row_id for row_id, _, _ in sample_rows],
+            "job_title": [title or "" for _, title, _ in sample_rows],
+            "description_snippet": [d[:snippet_len] + "..." if len(d) > snippet_len else d for d in descs],
+            "skills_taxonomy": ["|".join(skills) for skills in taxonomy_results],
+            "skills_llm": ["|".join(skills) for skills in llm_results],
+            "jaccard_similarity": [_jaccard(t, m) for t, m in zip(taxonomy_results, llm_results)],
+        }
+    )
+    # Same bytes as the csv.writer loop this replaced (csv module quoting, \r\n rows, 4-decimal scores).
+    report.to_csv(out_path, index=False, float_format="%.4f", lineterminator="\r\n", encoding="utf-8")
 
     logger.info("Wrote %d rows to %s", len(sample_rows), out_path)
 
@@ -212,39 +329,42 @@ def main() -> int:
 
 def _print_metrics(csv_path: Path, n_rows: int, skip_llm: bool = False) -> None:
     """Read comparison CSV and print summary metrics."""
-    import csv as csv_module
+    import csv
     jaccards: list[float] = []
-    tax_nonempty = 0
-    llm_nonempty = 0
-    tax_sizes: list[int] = []
-    llm_sizes: list[int] = []
-    with open(csv_path, encoding="utf-8") as f:
-        reader = csv_module.DictReader(f)
+    add_jaccard = jaccards.append
+    # Per column: rows with skills and their total skill count (no per-row size lists).
+    tax_nonempty = tax_total = 0
+    llm_nonempty = llm_total = 0
+    with open(csv_path, encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        tax_i = header.index("skills_taxonomy")
+        llm_i = header.index("skills_llm")
+        jac_i = header.index("jaccard_similarity")
         for row in reader:
-            j = row.get("jaccard_similarity", "")
-            if j:
-                try:
-                    jaccards.append(float(j))
-                except ValueError:
-                    pass
-            tax = (row.get("skills_taxonomy") or "").strip()
-            llm = (row.get("skills_llm") or "").strip()
+            j = row[jac_i]
+            # Our writer always emits "0.1234"-style scores; anything else (blank) is skipped.
+            if j[:1].isdigit():
+                add_jaccard(float(j))
+            tax = row[tax_i].strip()
+            llm = row[llm_i].strip()
+            # Skills are "|"-joined: count separators instead of splitting.
             if tax:
                 tax_nonempty += 1
-                tax_sizes.append(len(tax.split("|")))
+                tax_total += tax.count("|") + 1
             if llm:
                 llm_nonempty += 1
-                llm_sizes.append(len(llm.split("|")))
+                llm_total += llm.count("|") + 1
     print("\n--- Skills extraction comparison metrics ---")
     print(f"Rows: {n_rows}")
     if jaccards:
         print(f"Mean Jaccard similarity (taxonomy vs LLM): {sum(jaccards) / len(jaccards):.4f}")
     print(f"Rows with taxonomy skills non-empty: {tax_nonempty} ({100 * tax_nonempty / n_rows:.1f}%)")
     print(f"Rows with LLM skills non-empty: {llm_nonempty} ({100 * llm_nonempty / n_rows:.1f}%)" + (" (LLM skipped with --skip-llm)" if skip_llm else ""))
-    if tax_sizes:
-        print(f"Mean skills per row (taxonomy): {sum(tax_sizes) / len(tax_sizes):.2f}")
-    if llm_sizes:
-        print(f"Mean skills per row (LLM): {sum(llm_sizes) / len(llm_sizes):.2f}")
+    if tax_nonempty:
+        print(f"Mean skills per row (taxonomy): {tax_total / tax_nonempty:.2f}")
+    if llm_nonempty:
+        print(f"Mean skills per row (LLM): {llm_total / llm_nonempty:.2f}")
     if skip_llm:
         print("To compare with Gemini: set GOOGLE_API_KEY and run without --skip-llm.")
     print("--- Review comparison_skills.csv and choose taxonomy / LLM / hybrid (see docs/EVALUATE_SKILLS_EXTRACTION.md) ---\n")
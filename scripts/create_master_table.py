@@ -7,13 +7,15 @@ Uses only tables that exist (no error if some sources were not loaded).
 
 Usage:
   python scripts/create_master_table.py [--clean]              # view (clean = consistent types + is_complete)
+  python scripts/create_master_table.py --clean --external     # raw_* as external tables over GCS, then view
   python scripts/create_master_table.py --clean --create-table  # create empty table
-  python scripts/create_master_table.py --clean --materialize   # refresh table
+  python scripts/create_master_table.py --clean --materialize   # create or replace the table
 
-Requires: GOOGLE_CLOUD_PROJECT (or GCP_PROJECT), BIGQUERY_DATASET.
+Requires: GOOGLE_CLOUD_PROJECT (or GCP_PROJECT), BIGQUERY_DATASET; GCS_BUCKET with --external.
 """
 
 import argparse
+import functools
 import logging
 import os
 import sys
@@ -21,7 +23,9 @@ from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
-from ingestion.raw_table_names import RAW_TABLE_IDS
+from ingestion.bigquery_client import get_client, wildcard_matched_no_files
+from ingestion.config import gcs_bucket_config_error, normalize_gcs_bucket
+from ingestion.raw_table_names import RAW_TABLE_IDS, raw_gcs_prefix
 
 logging.basicConfig(
     level=logging.INFO,
@@ -53,8 +57,33 @@ def _existing_raw_tables(client, project: str, dataset_id: str):
     return [t for t in RAW_TABLE_IDS if t in found]
 
 
-def _union_sql(project: str, dataset_id: str, table_ids: list, clean: bool) -> str:
-    """Build union SQL from only the given raw table ids."""
+def _create_external_raw_tables(client, project: str, dataset_id: str, bucket: str, connection: str) -> None:
+    """
+    CREATE OR REPLACE each raw_* as an external table over its GCS Parquet prefix (replaces load_gcs_to_bigquery.py:
+    queries read the files in place). Sources with no Parquet files are skipped with a warning.
+    """
+    from google.api_core.exceptions import BadRequest, NotFound
+
+    with_connection = f"\nWITH CONNECTION `{connection}`" if connection else ""
+    for tid in RAW_TABLE_IDS:
+        uri = f"gs://{bucket}/{raw_gcs_prefix(tid)}*.parquet"
+        sql = (
+            f"CREATE OR REPLACE EXTERNAL TABLE `{project}.{dataset_id}.{tid}`{with_connection}\n"
+            f"OPTIONS (format = 'PARQUET', uris = ['{uri}'])"
+        )
+        try:
+            client.query(sql).result()
+            logger.info("Created/updated external table %s over %s", tid, uri)
+        except (BadRequest, NotFound) as e:
+            # Skip only a wildcard that matched no files (that source was not ingested); re-raise anything else.
+            if not wildcard_matched_no_files(e, uri):
+                raise
+            logger.warning("No Parquet files for %s under %s; skipped", tid, uri)
+
+
+@functools.lru_cache(maxsize=8)
+def _union_sql(project: str, dataset_id: str, table_ids: tuple, clean: bool) -> str:
+    """Build union SQL from only the given raw table ids (memoized for repeated calls from one process)."""
     if not table_ids:
         return ""
 
@@ -84,18 +113,28 @@ def main() -> int:
     parser.add_argument(
         "--materialize",
         action="store_true",
-        help="Create/refresh a materialized table (table must exist; use --create-table once to create it)",
+        help="Create or replace a materialized table (one CREATE OR REPLACE TABLE AS; no --create-table needed)",
     )
     parser.add_argument(
         "--create-table",
         action="store_true",
-        help="Create the master_jobs table (empty) then exit; use with --materialize to populate later",
+        help="Create the master_jobs table (empty, if it does not exist) then exit",
     )
     parser.add_argument(
         "--clean",
         action="store_true",
         help="Use clean union (consistent types + is_complete flag)",
     )
+    parser.add_argument(
+        "--external",
+        action="store_true",
+        help="First (re)create raw_* as external tables over gs://GCS_BUCKET/raw/<source>/*.parquet (no load step)",
+    )
+    parser.add_argument(
+        "--connection",
+        default=os.environ.get("BIGQUERY_CONNECTION", "").strip(),
+        help="With --external: BigLake connection id, e.g. my-project.us.gcs_conn (default: BIGQUERY_CONNECTION)",
+    )
     args = parser.parse_args()
 
     project = os.environ.get("GOOGLE_CLOUD_PROJECT") or os.environ.get("GCP_PROJECT", "").strip()
@@ -105,10 +144,17 @@ def main() -> int:
         logger.error("GOOGLE_CLOUD_PROJECT or GCP_PROJECT is required.")
         return 1
 
-    from google.cloud import bigquery
-    client = bigquery.Client(project=project)
+    client = get_client(project)
     ref = f"{project}.{dataset_id}.master_jobs"
 
+    if args.external:
+        bucket = normalize_gcs_bucket(os.environ.get("GCS_BUCKET", ""))
+        bucket_err = gcs_bucket_config_error(bucket)
+        if bucket_err:
+            logger.error("%s", bucket_err)
+            return 1
+        _create_external_raw_tables(client, project, dataset_id, bucket, args.connection)
+
     existing = _existing_raw_tables(client, project, dataset_id)
     if not existing:
         logger.error(
@@ -122,7 +168,7 @@ def main() -> int:
 
     if args.create_table:
         if args.clean:
-            union_sql = _union_sql(project, dataset_id, existing, clean=True)
+            union_sql = _union_sql(project, dataset_id, tuple(existing), clean=True)
             create_sql = f"CREATE TABLE IF NOT EXISTS `{ref}` AS\n{union_sql}\nLIMIT 0"
         else:
             first_table = existing[0]
@@ -134,20 +180,15 @@ def main() -> int:
         logger.info("Created table (if not exists) %s", ref)
         return 0
 
-    union_sql = _union_sql(project, dataset_id, existing, args.clean)
+    union_sql = _union_sql(project, dataset_id, tuple(existing), args.clean)
     if args.clean:
         logger.info("Using clean union (consistent types + is_complete)")
 
     if args.materialize:
-        materialize_sql = f"TRUNCATE TABLE `{ref}`;\nINSERT INTO `{ref}`\n{union_sql}"
-        try:
-            client.query(materialize_sql).result()
-            logger.info("Refreshed materialized table %s", ref)
-        except Exception as e:
-            if "Not found" in str(e) or "404" in str(e):
-                logger.error("Table %s does not exist. Run with --create-table first.", ref)
-            else:
-                raise
+        # One DDL statement: readers see the old table until the new one replaces it (never an empty table).
+        materialize_sql = f"CREATE OR REPLACE TABLE `{ref}` AS\n{union_sql}"
+        client.query(materialize_sql).result()
+        logger.info("Refreshed materialized table %s", ref)
     else:
         view_sql = f"CREATE OR REPLACE VIEW `{ref}` AS\n{union_sql}"
         client.query(view_sql).result()
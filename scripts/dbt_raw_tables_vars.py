@@ -25,6 +25,7 @@ ROOT = Path(__file__).resolve().parent.parent
 if str(ROOT) not in sys.path:
     sys.path.insert(0, str(ROOT))
 
+from ingestion.bigquery_client import get_client  # noqa: E402
 from ingestion.env_bootstrap import load_dotenv_repo  # noqa: E402
 from ingestion.raw_table_names import RAW_TABLE_IDS  # noqa: E402
 
@@ -53,9 +54,7 @@ def main() -> int:
         print("GOOGLE_CLOUD_PROJECT or GCP_PROJECT is required.", file=sys.stderr)
         return 1
 
-    from google.cloud import bigquery
-
-    client = bigquery.Client(project=project)
+    client = get_client(project)
     q = f"""
     SELECT table_name
     FROM `{project}.{dataset}.INFORMATION_SCHEMA.TABLES`
@@ -24,43 +24,35 @@ def main() -> None:
     source = sys.argv[1].strip().lower()
 
     import pandas as pd
+    from ingestion.sources.kaggle_download import download_complete, download_dataset, largest_csv
 
     if source == "kaggle_data_engineer":
         from ingestion.sources.kaggle_data_engineer_2023 import (
             DATASET,
             KAGGLE_BASE,
-            download_dataset,
-            _find_best_csv,
         )
         dest = Path(KAGGLE_BASE) / "lukkardata-data-engineer-job-postings-2023"
     elif source == "kaggle_linkedin":
         from ingestion.sources.kaggle_linkedin_postings import (
             DATASET,
             KAGGLE_BASE,
-            download_dataset,
         )
         dest = Path(KAGGLE_BASE) / "arshkon-linkedin-job-postings"
-        def _find_best_csv(d):
-            csvs = sorted(d.rglob("*.csv"), key=lambda p: p.stat().st_size, reverse=True)
-            return csvs[0] if csvs else None
     elif source == "kaggle_linkedin_skills":
         from ingestion.sources.kaggle_linkedin_jobs_skills_2024 import (
             DATASET,
             KAGGLE_BASE,
-            download_dataset,
         )
         dest = Path(KAGGLE_BASE) / "asaniczka-1-3m-linkedin-jobs-and-skills-2024"
-        def _find_best_csv(d):
-            csvs = sorted(d.rglob("*.csv"), key=lambda p: p.stat().st_size, reverse=True)
-            return csvs[0] if csvs else None
     else:
         print(f"Unknown source: {source}")
         sys.exit(1)
 
-    if not dest.exists():
+    # Same check as the ingestion streams: a directory without a matching manifest is a partial download.
+    if not download_complete(dest):
         print(f"Downloading {DATASET} to {dest} ...")
         download_dataset(DATASET)
-    csv_path = _find_best_csv(dest)
+    csv_path = largest_csv(dest)
     if not csv_path:
         print(f"No CSV found under {dest}")
         sys.exit(1)
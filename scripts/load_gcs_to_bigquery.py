@@ -11,11 +11,16 @@ import logging
 import os
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
 
+from ingestion.bigquery_client import get_client, wildcard_matched_no_files
 from ingestion.config import gcs_bucket_config_error, normalize_gcs_bucket
 
+if TYPE_CHECKING:
+    from google.cloud import bigquery
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
@@ -32,30 +37,52 @@ SOURCE_TO_GCS_AND_TABLE = {
 }
 
 
-def load_source(bucket: str, prefix: str, project: str, dataset_id: str, table_id: str) -> None:
-    """Load all Parquet files under gs://bucket/prefix/ into BigQuery dataset.table (WRITE_TRUNCATE)."""
-    import gcsfs
+def _source_uri(bucket: str, prefix: str) -> str:
+    # One wildcard URI, expanded by BigQuery itself (no client-side listing). "*" also matches "/", so files in
+    # nested folders are included, as with the previous recursive glob.
+    return f"gs://{bucket}/{prefix.rstrip('/')}/*.parquet"
+
+
+def submit_load_source(bucket: str, prefix: str, project: str, dataset_id: str, table_id: str) -> "bigquery.LoadJob":
+    """Start loading all Parquet files under gs://bucket/prefix/ into dataset.table (WRITE_TRUNCATE); don't wait."""
     from google.cloud import bigquery
 
-    fs = gcsfs.GCSFileSystem()
-    path = f"gs://{bucket}/{prefix.rstrip('/')}/**/*.parquet"
-    uris = fs.glob(path)
-    if not uris:
-        logger.warning("No Parquet files under gs://%s/%s", bucket, prefix)
-        return
-    # BigQuery requires full gs:// URIs; gcsfs.glob() may return paths without the scheme (e.g. bucket/path)
-    uris = [u if u.startswith("gs://") else f"gs://{u}" for u in uris]
-    client_bq = bigquery.Client(project=project)
-    table_ref = f"{project}.{dataset_id}.{table_id}"
+    uri = _source_uri(bucket, prefix)
+    client_bq = get_client(project)
+    # No autodetect: Parquet carries its schema in the file footer, so BigQuery takes it from there instead of
+    # sampling. WRITE_TRUNCATE replaces the table schema with the files' schema on every load.
     job_config = bigquery.LoadJobConfig(
         source_format=bigquery.SourceFormat.PARQUET,
         write_disposition=bigquery.WriteDisposition.WRITE_TRUNCATE,
-        autodetect=True,
     )
-    load_job = client_bq.load_table_from_uri(uris, table_ref, job_config=job_config)
-    load_job.result()
-    table = client_bq.get_table(table_ref)
-    logger.info("Loaded %d rows into %s from %d Parquet file(s)", table.num_rows, table_ref, len(uris))
+    return client_bq.load_table_from_uri(uri, f"{project}.{dataset_id}.{table_id}", job_config=job_config)
+
+
+def finish_load(load_job: "bigquery.LoadJob", bucket: str, prefix: str) -> None:
+    """Wait for a job from submit_load_source and log the loaded row count."""
+    try:
+        load_job.result()
+    except Exception as e:
+        # The wildcard matched nothing: the same outcome as an empty listing before. Anything else is a real failure.
+        if not wildcard_matched_no_files(e, _source_uri(bucket, prefix)):
+            raise
+        logger.warning("No Parquet files under gs://%s/%s", bucket, prefix)
+        return
+    dest = load_job.destination
+    # WRITE_TRUNCATE: the rows this job wrote are the table's rows.
+    logger.info(
+        "Loaded %s rows into %s.%s.%s from %s Parquet file(s)",
+        load_job.output_rows,
+        dest.project,
+        dest.dataset_id,
+        dest.table_id,
+        load_job.input_files,
+    )
+
+
+def load_source(bucket: str, prefix: str, project: str, dataset_id: str, table_id: str) -> None:
+    """Load all Parquet files under gs://bucket/prefix/ into BigQuery dataset.table (WRITE_TRUNCATE)."""
+    finish_load(submit_load_source(bucket, prefix, project, dataset_id, table_id), bucket, prefix)
 
 
 def main() -> int:
@@ -85,15 +112,24 @@ def main() -> int:
     else:
         to_load = [(args.source, SOURCE_TO_GCS_AND_TABLE[args.source])]
 
+    # Load jobs run server-side: submit them all, then wait, so wall time is the slowest job, not the sum.
+    jobs = []
+    failed = False
     for source_slug, (gcs_suffix, bq_table) in to_load:
         prefix = f"raw/{gcs_suffix}/"
         logger.info("Loading gs://%s/%s → %s.%s", bucket, prefix, dataset_id, bq_table)
         try:
-            load_source(bucket, prefix, project, dataset_id, bq_table)
+            jobs.append((source_slug, prefix, submit_load_source(bucket, prefix, project, dataset_id, bq_table)))
+        except Exception as e:
+            logger.exception("Load failed for %s: %s", source_slug, e)
+            failed = True
+    for source_slug, prefix, load_job in jobs:
+        try:
+            finish_load(load_job, bucket, prefix)
         except Exception as e:
             logger.exception("Load failed for %s: %s", source_slug, e)
-            return 1
-    return 0
+            failed = True
+    return 1 if failed else 0
 
 
 if __name__ == "__main__":
@@ -0,0 +1,35 @@
+"""Telling "the wildcard matched no files" apart from real BigQuery errors."""
+import pytest
+from google.api_core.exceptions import BadRequest, Forbidden, NotFound
+from ingestion.bigquery_client import wildcard_matched_no_files
+
+URI = "gs://my-bucket/raw/kaggle_data_engineer_2023/*.parquet"
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        "Not found: Uris List of uris (possibly) contains a wildcard but no files were matched",
+        f"Not found: URI {URI}",
+        f"not found: uri {URI.upper()}",
+    ],
+)
+def test_load_job_wildcard_with_no_files(message: str) -> None:
+    assert wildcard_matched_no_files(NotFound(message), URI)
+
+
+def test_external_table_wildcard_with_no_files() -> None:
+    assert wildcard_matched_no_files(BadRequest(f"Error while reading table: {URI} matched no files"), URI)
+
+
+@pytest.mark.parametrize(
+    "exc",
+    [
+        NotFound("Not found: Dataset my-project:horizon"),
+        BadRequest("Invalid value for uris"),
+        Forbidden(f"Access Denied: {URI}"),
+        ConnectionError("connection reset"),
+    ],
+)
+def test_other_errors_are_not_skipped(exc: Exception) -> None:
+    assert not wildcard_matched_no_files(exc, URI)
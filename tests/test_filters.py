@@ -0,0 +1,50 @@
+"""Date and data-domain filters used by every source."""
+import random
+from datetime import timedelta
+
+import pyarrow as pa
+from ingestion.config import CUTOFF_DATE
+from ingestion.filters import data_domain_mask, data_domain_only, last_3_years
+
+
+def test_last_3_years_boundary() -> None:
+    assert last_3_years(CUTOFF_DATE)
+    assert not last_3_years(CUTOFF_DATE - timedelta(days=1))
+    assert not last_3_years(None)
+
+
+def test_job_title_short_match_is_stripped() -> None:
+    assert data_domain_only(job_title_short="  Data Engineer ")
+
+
+def test_keyword_match_any_field_case_insensitive() -> None:
+    assert data_domain_only(title="Senior MACHINE LEARNING Engineer")
+    assert data_domain_only(description="Build the Data Lake on GCS")
+    assert data_domain_only(skills=["python", "ETL"])
+
+
+def test_keyword_is_substring_match() -> None:
+    # "ai " keeps its trailing space: matches "ai engineer" but not "retail".
+    assert data_domain_only(title="AI engineer")
+    assert not data_domain_only(title="retail")
+
+
+def test_non_data_rows_rejected() -> None:
+    assert not data_domain_only(title="Nurse", description="Night shift", job_title_short="Nurse")
+    assert not data_domain_only()
+
+
+def test_data_domain_mask_matches_data_domain_only() -> None:
+    rng = random.Random(0)
+    pieces = [None, "", "Big", "data", "Head of AI", "retail", "ETL", "nurse", " Data Scientist", "Cloud Engineer"]
+    skills = [None, ["data"], ["x", "ai"], ["ai", "x"]]
+    rows = [(rng.choice(pieces), rng.choice(pieces), rng.choice(skills), rng.choice(pieces)) for _ in range(500)]
+    short = [s.strip() if s else None for _, _, _, s in rows]
+    mask = data_domain_mask(
+        title=pa.array([t or None for t, _, _, _ in rows], pa.string()),
+        description=pa.array([d or None for _, d, _, _ in rows], pa.string()),
+        skills=pa.array([" ".join(k) if k else None for _, _, k, _ in rows], pa.string()),
+        job_title_short=pa.array([s or None for s in short], pa.string()),
+    )
+    expected = [data_domain_only(title=t, description=d, skills=k, job_title_short=s) for t, d, k, s in rows]
+    assert mask.to_pylist() == expected
@@ -0,0 +1,165 @@
+"""Kaggle CSV sources: column mapping and filters over a local CSV (no download)."""
+import os
+from datetime import timedelta
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from ingestion.config import CUTOFF_DATE
+from ingestion.sources import kaggle_data_engineer_2023 as data_engineer
+from ingestion.sources import kaggle_download
+from ingestion.sources import kaggle_linkedin_postings as linkedin
+from ingestion.sources.csv_stream import csv_to_parquet, iter_csv_frames, map_chunks
+from ingestion.sources.kaggle_download import (
+    MANIFEST_NAME,
+    csvs_by_size,
+    download_complete,
+    manifest_csv,
+    write_manifest,
+)
+from ingestion.sources.kaggle_frames import coalesce_text, rebatch, split_skills
+
+
+def _write_csv(base: Path, slug: str, frame: pd.DataFrame) -> None:
+    (base / slug).mkdir(parents=True)
+    frame.to_csv(base / slug / "jobs.csv", index=False)
+    write_manifest(base / slug)
+
+
+def test_linkedin_postings_date_and_domain_filters(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    recent = (CUTOFF_DATE + timedelta(days=30)).isoformat()
+    old = (CUTOFF_DATE - timedelta(days=30)).isoformat()
+    _write_csv(
+        tmp_path,
+        "arshkon-linkedin-job-postings",
+        pd.DataFrame(
+            {
+                "title": ["Data Engineer", "Nurse", "Data Engineer", "Nurse"],
+                "description": [" Build pipelines ", None, None, " "],
+                "company_name": ["Acme", "Clinic", "Acme", "Clinic"],
+                "listed_time": [recent, recent, old, recent],
+                "skills_desc": [None, None, None, "etl|spark"],
+            }
+        ),
+    )
+    monkeypatch.setattr(linkedin, "KAGGLE_BASE", str(tmp_path))
+    rows = [r for batch in linkedin.stream_kaggle_linkedin_postings() for r in batch]
+    # skills_desc maps to job_description too and wins when present; its "etl" keeps the nurse row.
+    assert [(r["job_title"], r["job_description"], r["skills"]) for r in rows] == [
+        ("Data Engineer", "Build pipelines", None),
+        ("Nurse", "etl|spark", None),
+    ]
+    assert rows[0]["posted_date"] == recent
+
+
+def test_data_engineer_location_and_salary_join(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    _write_csv(
+        tmp_path,
+        "lukkardata-data-engineer-job-postings-2023",
+        pd.DataFrame(
+            {
+                "Job_details": [" Data Engineer ", "  "],
+                "Job_details.4": ["Austin", None],
+                "Job_details.5": [None, None],
+                "Job_details.6": ["US", None],
+                "Salary.2": [120000, None],
+                "Salary.3": ["USD", None],
+            }
+        ),
+    )
+    monkeypatch.setattr(data_engineer, "KAGGLE_BASE", str(tmp_path))
+    monkeypatch.setattr(data_engineer, "_WITHIN_WINDOW", True)
+    rows = [r for batch in data_engineer.stream_kaggle_data_engineer_2023() for r in batch]
+    assert [(r["job_title"], r["location"], r["salary_info"]) for r in rows] == [
+        ("Data Engineer", "Austin, US", "120000.0 USD"),
+        (None, None, None),
+    ]
+
+
+def test_iter_csv_frames_matches_read_csv(tmp_path: Path) -> None:
+    path = tmp_path / "dup.csv"
+    path.write_text('a,a,b\n x ,NA,"multi\nline"\n,2,\nz,None,3\n')
+    got = pd.concat(iter_csv_frames(path, ["a.1", "b"]))
+    expected = pd.read_csv(path, usecols=["a.1", "b"], dtype="string")
+    assert list(got.columns) == ["a.1", "b"]
+    assert got.astype(object).where(got.notna(), None).values.tolist() == (
+        expected.astype(object).where(expected.notna(), None).values.tolist()
+    )
+
+
+def test_map_chunks_keeps_order_in_process_pool() -> None:
+    chunks = [list(range(n)) for n in (3, 1, 4, 1, 5, 9, 2, 6)]
+    assert list(map_chunks(sum, chunks, 10, workers=2)) == [sum(c, 10) for c in chunks]
+
+
+def test_iter_csv_frames_reads_parquet_copy_unless_stale(tmp_path: Path) -> None:
+    path = tmp_path / "jobs.csv"
+    path.write_text('a,a,b\n x ,NA,"multi\nline"\n,2,\n')
+    from_csv = pd.concat(iter_csv_frames(path, ["b", "a.1"]))
+    assert csv_to_parquet(path) == tmp_path / "jobs.parquet"
+    pd.testing.assert_frame_equal(pd.concat(iter_csv_frames(path, ["b", "a.1"])), from_csv)
+    path.write_text("a,a,b\nnew,csv,rows\n")
+    os.utime(path, (path.stat().st_atime, path.stat().st_mtime + 60))
+    assert pd.concat(iter_csv_frames(path, ["b"]))["b"].tolist() == ["rows"]
+
+
+@pytest.mark.parametrize("dtype", ["str", object])
+def test_coalesce_text_last_value_wins_with_str_strip(dtype: object) -> None:
+    chunk = pd.DataFrame(
+        {
+            "a": ["\xa0first\u3000", "keep", None, "x"],
+            "b": [None, " \x1c ", "\tlast\n", None],
+        },
+        dtype=dtype,
+    )
+    assert coalesce_text(chunk, ["a", "b"], skip_blank=False).tolist() == ["first", "", "last", "x"]
+    assert coalesce_text(chunk, ["a", "b"], skip_blank=True).tolist() == ["first", "keep", "last", "x"]
+    assert coalesce_text(chunk, [], skip_blank=True).tolist() == [None] * 4
+
+
+def test_split_skills_keeps_linkedin_rules() -> None:
+    chunk = pd.DataFrame({"skills": ["[sql; python]", "etl, spark", " a |  | b ", "  ", None, "[]"]}, dtype="str")
+    postings = split_skills(chunk, ["skills"], separators=r"[;|]", trigger=r"^\[|[;|]", remove=r"[\[\]]")
+    assert postings.to_pylist() == [["sql", "python"], ["etl, spark"], ["a", "b"], None, None, []]
+    skills_2024 = split_skills(chunk, ["skills"], separators=r"[;|,]", trigger=r"[;|,]")
+    assert skills_2024.to_pylist() == [["[sql", "python]"], ["etl", "spark"], ["a", "b"], None, None, ["[]"]]
+
+
+def test_download_complete_needs_manifest_with_matching_size(tmp_path: Path) -> None:
+    (tmp_path / "small.csv").write_text("a\n1\n")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "main.csv").write_text("a,b\n1,2\n3,4\n")
+    assert csvs_by_size(tmp_path) == [tmp_path / "sub" / "main.csv", tmp_path / "small.csv"]
+    assert not download_complete(tmp_path)
+    assert write_manifest(tmp_path)["csv_path"] == "sub/main.csv"
+    assert manifest_csv(tmp_path) == tmp_path / "sub" / "main.csv"
+    assert download_complete(tmp_path)
+    (tmp_path / "sub" / "main.csv").write_text("a,b\n1,2\n")
+    assert not download_complete(tmp_path)
+    (tmp_path / MANIFEST_NAME).write_text("{truncated")
+    assert not download_complete(tmp_path)
+
+
+def test_rebatch_cuts_exact_batches_across_chunks() -> None:
+    chunks = [list(range(0, 7)), [], list(range(7, 9)), list(range(9, 20))]
+    batches = list(rebatch(chunks, 4))
+    assert [len(b) for b in batches] == [4, 4, 4, 4, 4]
+    assert [x for b in batches for x in b] == list(range(20))
+    assert list(rebatch([[1, 2, 3]], 5)) == [[1, 2, 3]]
+
+
+def test_download_keeps_going_when_a_csv_cannot_be_transcoded(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    class FakeApi:
+        def authenticate(self) -> None:
+            pass
+
+        def dataset_download_files(self, dataset: str, path: str, unzip: bool, quiet: bool) -> None:
+            Path(path, "jobs.csv").write_text("a,b\n1,2\n3,4\n")
+            Path(path, "meta.csv").write_bytes(b"a\n\xff\xfe\n")  # not UTF-8: pyarrow rejects it
+
+    monkeypatch.setattr(kaggle_download, "ensure_kaggle_credentials", lambda: None)
+    monkeypatch.setattr(kaggle_download, "KaggleApi", FakeApi)
+    dest = kaggle_download.download_dataset("owner/name", path=str(tmp_path))
+    # No Parquet copy (and no .tmp left) for meta.csv; the manifest is still written.
+    assert sorted(p.name for p in dest.iterdir()) == [MANIFEST_NAME, "jobs.csv", "jobs.parquet", "meta.csv"]
+    assert download_complete(dest)
@@ -1,8 +1,8 @@
 """Contract tests for canonical job schema."""
-from datetime import date
+from datetime import date, datetime
 
 import pytest
-from ingestion.schema import JOBS_COLUMNS, RawJobRow
+from ingestion.schema import JOBS_COLUMNS, RawJobRow, job_load_dict
 from pydantic import ValidationError
 
 
@@ -41,3 +41,20 @@ def test_raw_job_row_roundtrip_json() -> None:
 def test_raw_job_row_requires_source_fields() -> None:
     with pytest.raises(ValidationError):
         RawJobRow(source_id="x")  # type: ignore[call-arg]
+
+
+def test_job_load_dict_matches_model_dump() -> None:
+    ingested = datetime(2024, 3, 1, 12, 30, 5, 123456)
+    fields = dict(
+        source_id="test_source",
+        source_name="Test",
+        job_title="Data Engineer",
+        location="Remote",
+        posted_date=date(2024, 1, 15),
+        skills=["Python", "SQL"],
+        salary_info="120000.0",
+    )
+    expected = RawJobRow(**fields, ingested_at=ingested).to_load_dict()
+    got = job_load_dict(**fields, ingested_at=ingested.isoformat())
+    assert got == expected
+    assert list(got) == list(JOBS_COLUMNS)
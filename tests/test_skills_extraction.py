@@ -0,0 +1,25 @@
+"""Taxonomy skills extraction and LLM response parsing (no LLM / network)."""
+from ingestion.skills_extraction import _parse_skills_json, extract_skills_taxonomy
+
+
+def test_taxonomy_canonical_names_sorted_deduped() -> None:
+    out = extract_skills_taxonomy("Data Engineer", "PySpark, Apache Spark and spark; Python3 + SQL on AWS")
+    assert out == ["AWS", "Python", "SQL", "Spark"]
+
+
+def test_taxonomy_whole_word_only() -> None:
+    assert extract_skills_taxonomy("Hive keeper", "sqlite and javascript") == ["Hive"]
+
+
+def test_taxonomy_overlapping_phrases_all_reported() -> None:
+    assert extract_skills_taxonomy(None, "google cloud storage, dbt core") == ["Cloud Storage", "GCP", "dbt"]
+
+
+def test_taxonomy_empty_input() -> None:
+    assert extract_skills_taxonomy(None, "   ") == []
+
+
+def test_parse_skills_json_strips_code_fence() -> None:
+    assert _parse_skills_json('```json\n["Python", " SQL ", ""]\n```') == ["Python", "SQL"]
+    assert _parse_skills_json('["dbt"]') == ["dbt"]
+    assert _parse_skills_json("not json") == []